@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -18,6 +19,15 @@ BLOCK_WORK_SIZE = 112
 MAX_TIPS = TIPS_LIMIT
 MIN_HEADER_SIZE = 91
 
+# Fixed-width runs of the header encodings, packed in one call each:
+# [version:1][height:8][timestamp:8][nonce:8][extra_nonce:32]
+_HEADER_PREFIX = struct.Struct(">BQQQ32s")
+# [version:1][height:8][tips_hash:32][txs_hash:32]
+_WORK_HASH_INPUT = struct.Struct(">BQ32s32s")
+# [timestamp:8][nonce:8]
+_TIMESTAMP_NONCE = struct.Struct(">QQ")
+_PACK_U16 = struct.Struct(">H").pack
+
 
 def max_header_size() -> int:
     # 90 fixed + tips + txs + miner + vrf flag + vrf data (max)
@@ -63,16 +73,19 @@ def serialize_header(header: BlockHeader) -> bytes:
         if len(tx) != 32:
             raise ValueError("tx hash must be 32 bytes")
 
-    out = bytearray()
-    out.append(header.version & 0xFF)
-    out.extend(header.height.to_bytes(8, "big"))
-    out.extend(header.timestamp.to_bytes(8, "big"))
-    out.extend(header.nonce.to_bytes(8, "big"))
-    out.extend(header.extra_nonce)
+    out = bytearray(
+        _HEADER_PREFIX.pack(
+            header.version & 0xFF,
+            header.height,
+            header.timestamp,
+            header.nonce,
+            header.extra_nonce,
+        )
+    )
     out.append(len(header.tips) & 0xFF)
     for tip in header.tips:
         out.extend(tip)
-    out.extend(len(header.txs_hashes).to_bytes(2, "big"))
+    out.extend(_PACK_U16(len(header.txs_hashes)))
     for tx in header.txs_hashes:
         out.extend(tx)
     out.extend(header.miner)
@@ -100,12 +113,10 @@ def txs_hash(txs_hashes: List[bytes]) -> bytes:
 
 
 def work_hash(version: int, height: int, tips: List[bytes], txs_hashes: List[bytes]) -> bytes:
-    data = bytearray()
-    data.append(version & 0xFF)
-    data.extend(height.to_bytes(8, "big"))
-    data.extend(tips_hash(tips))
-    data.extend(txs_hash(txs_hashes))
-    return blake3(bytes(data)).digest()
+    data = _WORK_HASH_INPUT.pack(
+        version & 0xFF, height, tips_hash(tips), txs_hash(txs_hashes)
+    )
+    return blake3(data).digest()
 
 
 def pow_hash_input(
@@ -115,13 +126,9 @@ def pow_hash_input(
     extra_nonce: bytes,
     miner: bytes,
 ) -> bytes:
-    data = bytearray()
-    data.extend(work_hash_bytes)
-    data.extend(timestamp.to_bytes(8, "big"))
-    data.extend(nonce.to_bytes(8, "big"))
-    data.extend(extra_nonce)
-    data.extend(miner)
-    return bytes(data)
+    return b"".join(
+        (work_hash_bytes, _TIMESTAMP_NONCE.pack(timestamp, nonce), extra_nonce, miner)
+    )
 
 
 def header_size(header: BlockHeader) -> int:
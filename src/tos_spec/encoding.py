@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from typing import Optional
 
@@ -43,22 +44,37 @@ TX_TYPE_IDS = {
     TransactionType.AGENT_ACCOUNT: 23,
 }
 
+# Fixed-width runs shared by the signing and wire encodings, packed in one
+# call each (lengths are validated before packing):
+# [version:1][chain_id:1][source:32][tx_type_id:1]
+_TX_HEADER = struct.Struct(">BB32sB")
+# [fee:8][fee_type:1][nonce:8]
+_TX_FEE_NONCE = struct.Struct(">QBQ")
+# [ref_hash:32][ref_topo:8]
+_TX_REFERENCE = struct.Struct(">32sQ")
+
+# Big-endian unsigned packers for Writer, compiled once.
+_PACK_U8 = struct.Struct(">B").pack
+_PACK_U16 = struct.Struct(">H").pack
+_PACK_U32 = struct.Struct(">I").pack
+_PACK_U64 = struct.Struct(">Q").pack
+
 
 @dataclass
 class Writer:
     buf: bytearray
 
     def write_u8(self, v: int) -> None:
-        self.buf.extend(int(v).to_bytes(1, "big", signed=False))
+        self.buf.extend(_PACK_U8(int(v)))
 
     def write_u16(self, v: int) -> None:
-        self.buf.extend(int(v).to_bytes(2, "big", signed=False))
+        self.buf.extend(_PACK_U16(int(v)))
 
     def write_u32(self, v: int) -> None:
-        self.buf.extend(int(v).to_bytes(4, "big", signed=False))
+        self.buf.extend(_PACK_U32(int(v)))
 
     def write_u64(self, v: int) -> None:
-        self.buf.extend(int(v).to_bytes(8, "big", signed=False))
+        self.buf.extend(_PACK_U64(int(v)))
 
     def write_bytes(self, b: bytes) -> None:
         self.buf.extend(b)
@@ -436,23 +452,17 @@ def encode_signing_bytes(tx: Transaction, current_time: Optional[int] = None) ->
     if not (0 <= tx.chain_id <= 0xFF):
         raise SpecError(ErrorCode.INVALID_FORMAT, "chain_id must fit u8")
 
-    w = Writer(bytearray())
-    w.write_u8(tx.version)
-    w.write_u8(tx.chain_id)
-    w.write_bytes(tx.source)
-
-    w.write_u8(TX_TYPE_IDS[tx.tx_type])
+    w = Writer(
+        bytearray(_TX_HEADER.pack(tx.version, tx.chain_id, tx.source, TX_TYPE_IDS[tx.tx_type]))
+    )
 
     _encode_payload(w, tx, current_time)
 
-    w.write_u64(tx.fee)
     if not isinstance(tx.fee_type, FeeType):
         raise SpecError(ErrorCode.INVALID_PAYLOAD, "fee_type invalid")
-    w.write_u8(tx.fee_type)
-    w.write_u64(tx.nonce)
+    w.write_bytes(_TX_FEE_NONCE.pack(tx.fee, tx.fee_type, tx.nonce))
 
-    w.write_bytes(tx.reference_hash)
-    w.write_u64(tx.reference_topoheight)
+    w.write_bytes(_TX_REFERENCE.pack(tx.reference_hash, tx.reference_topoheight))
 
     return bytes(w.buf)
 
@@ -483,20 +493,15 @@ def encode_transaction(tx: Transaction, current_time: Optional[int] = None) -> b
     if not (0 <= tx.chain_id <= 0xFF):
         raise SpecError(ErrorCode.INVALID_FORMAT, "chain_id must fit u8")
 
-    w = Writer(bytearray())
-    w.write_u8(tx.version)
-    w.write_u8(tx.chain_id)
-    w.write_bytes(tx.source)
-
-    w.write_u8(TX_TYPE_IDS[tx.tx_type])
+    w = Writer(
+        bytearray(_TX_HEADER.pack(tx.version, tx.chain_id, tx.source, TX_TYPE_IDS[tx.tx_type]))
+    )
 
     _encode_payload(w, tx, current_time)
 
-    w.write_u64(tx.fee)
     if not isinstance(tx.fee_type, FeeType):
         raise SpecError(ErrorCode.INVALID_PAYLOAD, "fee_type invalid")
-    w.write_u8(tx.fee_type)
-    w.write_u64(tx.nonce)
+    w.write_bytes(_TX_FEE_NONCE.pack(tx.fee, tx.fee_type, tx.nonce))
 
     # UNO fields (only for Uno/Shield/Unshield)
     if tx.tx_type in (
@@ -517,8 +522,7 @@ def encode_transaction(tx: Transaction, current_time: Optional[int] = None) -> b
         elif tx.tx_type == TransactionType.UNSHIELD_TRANSFERS and tx.range_proof is not None:
             w.write_bytes(tx.range_proof)
     # Reference
-    w.write_bytes(tx.reference_hash)
-    w.write_u64(tx.reference_topoheight)
+    w.write_bytes(_TX_REFERENCE.pack(tx.reference_hash, tx.reference_topoheight))
 
     # Multisig (Option<MultiSig>)
     _write_multisig(w, tx.multisig)
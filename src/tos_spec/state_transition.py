@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import replace
 from typing import Optional
 
@@ -219,7 +218,7 @@ def apply_tx(state: ChainState, tx: Transaction) -> tuple[ChainState, Transition
     except SpecError as exc:
         return state, TransitionResult.failure(exc)
 
-    working = deepcopy(state)
+    working = state.clone()
     sender = working.accounts[tx.source]
 
     try:
@@ -6,6 +6,8 @@ scalar multiplication. No external file dependency at import time.
 
 from __future__ import annotations
 
+import functools
+
 import tos_signer
 
 from .encoding import encode_signing_bytes
@@ -23,15 +25,29 @@ GRACE = bytes(tos_signer.get_public_key(8))
 HEIDI = bytes(tos_signer.get_public_key(9))
 IVAN = bytes(tos_signer.get_public_key(10))
 
-# Map address bytes -> seed_byte
+# Map address bytes -> seed_byte. Keyed by the constants above rather than
+# fresh derivations, so lookups with those same objects short-circuit on
+# identity.
 SEED_MAP: dict[bytes, int] = {
-    bytes(tos_signer.get_public_key(i)): i for i in range(1, 11)
+    addr: i
+    for i, addr in enumerate(
+        (MINER, ALICE, BOB, CAROL, DAVE, EVE, FRANK, GRACE, HEIDI, IVAN), start=1
+    )
 }
 
+# Fixed time to keep signatures and wire hex deterministic across regenerations.
+SIGNING_TIME = 1700000000
+
+
+@functools.lru_cache(maxsize=None)
+def _sign(signing_bytes: bytes, seed: int) -> bytes:
+    # tos_signer derives the nonce from key and message, so signatures are a
+    # pure function of these arguments and safe to memoise.
+    return bytes(tos_signer.sign_data(signing_bytes, seed))
+
 
 def sign_transaction(tx: Transaction) -> bytes:
     """Sign a transaction using the test account's seed byte."""
     seed = SEED_MAP[tx.source]
-    # Fixed time to keep signatures and wire hex deterministic across regenerations.
-    signing_bytes = encode_signing_bytes(tx, current_time=1700000000)
-    return bytes(tos_signer.sign_data(signing_bytes, seed))
+    signing_bytes = encode_signing_bytes(tx, current_time=SIGNING_TIME)
+    return _sign(signing_bytes, seed)
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from ..config import MAX_MULTISIG_PARTICIPANTS
 from ..errors import ErrorCode, SpecError
 from ..types import (
@@ -69,7 +67,7 @@ def _verify_multisig(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_multisig(state: ChainState, tx: Transaction) -> ChainState:
-    next_state = deepcopy(state)
+    next_state = state.clone()
     p = tx.payload
     threshold = p.get("threshold", 0)
     participants = p.get("participants", [])
@@ -160,7 +158,7 @@ def _verify_agent_account(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_agent_account(state: ChainState, tx: Transaction) -> ChainState:
-    next_state = deepcopy(state)
+    next_state = state.clone()
     p = tx.payload
     variant = p.get("variant", "")
     zero = bytes(32)
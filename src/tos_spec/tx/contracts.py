@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from blake3 import blake3
 
 from ..config import BURN_PER_CONTRACT, COIN_VALUE, MAX_DEPOSIT_PER_INVOKE_CALL, MAX_GAS_USAGE_PER_TX
@@ -54,7 +52,7 @@ def _verify_deploy(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_deploy(state: ChainState, tx: Transaction) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     p = tx.payload
     module = p.get("module", b"")
     if isinstance(module, (list, tuple)):
@@ -113,7 +111,7 @@ def _verify_invoke(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_invoke(state: ChainState, tx: Transaction) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     p = tx.payload
     max_gas = p.get("max_gas", 0)
 
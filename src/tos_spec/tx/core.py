@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from ..config import EXTRA_DATA_LIMIT_SIZE, EXTRA_DATA_LIMIT_SUM_SIZE, MAX_TRANSFER_COUNT
 from ..errors import ErrorCode, SpecError
 from ..types import AccountState, ChainState, Transaction, TransactionType, TransferPayload
@@ -70,7 +68,7 @@ def verify(state: ChainState, tx: Transaction) -> None:
 
 
 def apply(state: ChainState, tx: Transaction) -> ChainState:
-    next_state = deepcopy(state)
+    next_state = state.clone()
     if tx.tx_type == TransactionType.BURN:
         sender = next_state.accounts.get(tx.source)
         if sender is None:
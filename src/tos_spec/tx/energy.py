@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from ..config import (
     COIN_VALUE,
     MAX_DELEGATEES,
@@ -112,7 +110,7 @@ def _verify_freeze_tos(state: ChainState, tx: Transaction, p: EnergyPayload) ->
 
 
 def _apply_freeze_tos(state: ChainState, tx: Transaction, p: EnergyPayload) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     amount = p.amount or 0
     days = p.duration.days
     bpd = _blocks_per_day(ns.network_chain_id)
@@ -211,7 +209,7 @@ def _verify_freeze_delegate(state: ChainState, tx: Transaction, p: EnergyPayload
 
 
 def _apply_freeze_delegate(state: ChainState, tx: Transaction, p: EnergyPayload) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     delegatees = p.delegatees or []
     days = p.duration.days
     bpd = _blocks_per_day(ns.network_chain_id)
@@ -304,7 +302,7 @@ def _verify_unfreeze_tos(state: ChainState, tx: Transaction, p: EnergyPayload) -
 
 
 def _apply_unfreeze_tos(state: ChainState, tx: Transaction, p: EnergyPayload) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     amount = p.amount or 0
     from_delegation = p.from_delegation or False
     bpd = _blocks_per_day(ns.network_chain_id)
@@ -350,7 +348,7 @@ def _verify_withdraw_unfrozen(state: ChainState, tx: Transaction, p: EnergyPaylo
 
 
 def _apply_withdraw_unfrozen(state: ChainState, tx: Transaction, p: EnergyPayload) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     height = ns.global_state.block_height
 
     sender = ns.accounts.get(tx.source)
@@ -11,8 +11,6 @@ All structural / amount / limit validations are enforced.
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from ..config import (
     EXTRA_DATA_LIMIT_SIZE,
     EXTRA_DATA_LIMIT_SUM_SIZE,
@@ -82,7 +80,7 @@ def _verify_uno_transfers(state: ChainState, tx: Transaction) -> None:
 def _apply_uno_transfers(state: ChainState, tx: Transaction) -> ChainState:
     # UNO transfers operate on encrypted balances; in the spec we treat them
     # as a no-op on plaintext state (ZKP verification happens at the crypto layer).
-    return deepcopy(state)
+    return state.clone()
 
 
 # --- Shield transfers (TOS -> UNO) ---
@@ -133,7 +131,7 @@ def _verify_shield_transfers(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_shield_transfers(state: ChainState, tx: Transaction) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     p = tx.payload
     transfers = p.get("transfers", [])
 
@@ -176,7 +174,7 @@ def _verify_unshield_transfers(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_unshield_transfers(state: ChainState, tx: Transaction) -> ChainState:
-    ns = deepcopy(state)
+    ns = state.clone()
     p = tx.payload
     transfers = p.get("transfers", [])
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-from copy import deepcopy
 
 from ..config import (
     MAX_NAME_LENGTH,
@@ -102,7 +101,7 @@ def _verify_register_name(state: ChainState, tx: Transaction) -> None:
 
 
 def _apply_register_name(state: ChainState, tx: Transaction) -> ChainState:
-    next_state = deepcopy(state)
+    next_state = state.clone()
     p = tx.payload
     name = p.get("name", "").lower()
     height = next_state.global_state.block_height
@@ -37,18 +37,18 @@ class TransactionType(Enum):
     REGISTER_NAME = "register_name"
 
 
-@dataclass
+@dataclass(slots=True)
 class FreezeDuration:
     days: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DelegationEntry:
     delegatee: bytes
     amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergyPayload:
     variant: str
     amount: Optional[int] = None
@@ -59,7 +59,7 @@ class EnergyPayload:
     delegatee_address: Optional[bytes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferPayload:
     asset: bytes
     destination: bytes
@@ -67,7 +67,7 @@ class TransferPayload:
     extra_data: Optional[bytes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     version: TxVersion
     chain_id: int
@@ -85,18 +85,18 @@ class Transaction:
     signature: Optional[bytes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SignatureId:
     signer_id: int
     signature: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiSig:
     signatures: List[SignatureId]
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountState:
     address: bytes
     balance: int = 0
@@ -106,8 +106,19 @@ class AccountState:
     flags: int = 0
     data: bytes = b""
 
+    def clone(self) -> "AccountState":
+        return AccountState(
+            address=self.address,
+            balance=self.balance,
+            nonce=self.nonce,
+            frozen=self.frozen,
+            energy=self.energy,
+            flags=self.flags,
+            data=self.data,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class GlobalState:
     total_supply: int = 0
     total_burned: int = 0
@@ -115,20 +126,32 @@ class GlobalState:
     block_height: int = 0
     timestamp: int = 0
 
+    def clone(self) -> "GlobalState":
+        return GlobalState(
+            total_supply=self.total_supply,
+            total_burned=self.total_burned,
+            total_energy=self.total_energy,
+            block_height=self.block_height,
+            timestamp=self.timestamp,
+        )
+
 
 # --- Multisig ---
 
 
-@dataclass
+@dataclass(slots=True)
 class MultisigConfig:
     threshold: int
     participants: list[bytes]
 
+    def clone(self) -> "MultisigConfig":
+        return MultisigConfig(threshold=self.threshold, participants=list(self.participants))
+
 
 # --- Agent Account ---
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentAccountMeta:
     owner: bytes
     controller: bytes
@@ -137,40 +160,69 @@ class AgentAccountMeta:
     energy_pool: Optional[bytes] = None
     session_key_root: Optional[bytes] = None
 
+    def clone(self) -> "AgentAccountMeta":
+        return AgentAccountMeta(
+            owner=self.owner,
+            controller=self.controller,
+            policy_hash=self.policy_hash,
+            status=self.status,
+            energy_pool=self.energy_pool,
+            session_key_root=self.session_key_root,
+        )
+
 
 # --- TNS (Name Service) ---
 
 
-@dataclass
+@dataclass(slots=True)
 class TnsRecord:
     name: str
     owner: bytes
     registered_at: int = 0
 
+    def clone(self) -> "TnsRecord":
+        return TnsRecord(name=self.name, owner=self.owner, registered_at=self.registered_at)
+
 
 # --- Contract ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractState:
     deployer: bytes
     module_hash: bytes
     module: bytes = b""
     storage: dict[bytes, bytes] = field(default_factory=dict)
 
+    def clone(self) -> "ContractState":
+        return ContractState(
+            deployer=self.deployer,
+            module_hash=self.module_hash,
+            module=self.module,
+            storage=dict(self.storage),
+        )
+
 
 # --- Energy domain state ---
 
 
-@dataclass
+@dataclass(slots=True)
 class FreezeRecord:
     amount: int
     energy_gained: int
     freeze_height: int = 0
     unlock_height: int = 0
 
+    def clone(self) -> "FreezeRecord":
+        return FreezeRecord(
+            amount=self.amount,
+            energy_gained=self.energy_gained,
+            freeze_height=self.freeze_height,
+            unlock_height=self.unlock_height,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class DelegatedFreezeRecord:
     delegatee: bytes
     amount: int
@@ -178,15 +230,31 @@ class DelegatedFreezeRecord:
     freeze_height: int = 0
     unlock_height: int = 0
 
+    def clone(self) -> "DelegatedFreezeRecord":
+        return DelegatedFreezeRecord(
+            delegatee=self.delegatee,
+            amount=self.amount,
+            energy_gained=self.energy_gained,
+            freeze_height=self.freeze_height,
+            unlock_height=self.unlock_height,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class PendingUnfreeze:
     amount: int
     from_delegation: bool = False
     expire_height: int = 0
 
+    def clone(self) -> "PendingUnfreeze":
+        return PendingUnfreeze(
+            amount=self.amount,
+            from_delegation=self.from_delegation,
+            expire_height=self.expire_height,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class EnergyResource:
     freeze_records: list[FreezeRecord] = field(default_factory=list)
     delegated_records: list[DelegatedFreezeRecord] = field(default_factory=list)
@@ -194,11 +262,20 @@ class EnergyResource:
     frozen_tos: int = 0
     energy: int = 0
 
+    def clone(self) -> "EnergyResource":
+        return EnergyResource(
+            freeze_records=[r.clone() for r in self.freeze_records],
+            delegated_records=[r.clone() for r in self.delegated_records],
+            pending_unfreezes=[p.clone() for p in self.pending_unfreezes],
+            frozen_tos=self.frozen_tos,
+            energy=self.energy,
+        )
+
 
 # --- ChainState (expanded) ---
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainState:
     accounts: dict[bytes, AccountState] = field(default_factory=dict)
     global_state: GlobalState = field(default_factory=GlobalState)
@@ -210,3 +287,17 @@ class ChainState:
     tns_by_owner: dict[bytes, str] = field(default_factory=dict)
     contracts: dict[bytes, ContractState] = field(default_factory=dict)
     energy_resources: dict[bytes, EnergyResource] = field(default_factory=dict)
+
+    def clone(self) -> "ChainState":
+        """Independent copy of the state (same result as ``deepcopy``, much cheaper)."""
+        return ChainState(
+            accounts={k: v.clone() for k, v in self.accounts.items()},
+            global_state=self.global_state.clone(),
+            network_chain_id=self.network_chain_id,
+            multisig_configs={k: v.clone() for k, v in self.multisig_configs.items()},
+            agent_accounts={k: v.clone() for k, v in self.agent_accounts.items()},
+            tns_names={k: v.clone() for k, v in self.tns_names.items()},
+            tns_by_owner=dict(self.tns_by_owner),
+            contracts={k: v.clone() for k, v in self.contracts.items()},
+            energy_resources={k: v.clone() for k, v in self.energy_resources.items()},
+        )
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Any, Callable
 
 import pytest
 
+from tos_spec.codec_adapter import tx_to_serde_json
 from tos_spec.state_transition import apply_block, apply_tx
 from tos_spec.test_accounts import SEED_MAP, sign_transaction
 from tos_spec.types import ChainState, Transaction
-from tools.fixtures_io import state_to_json, tx_to_json
+from tools.fixtures_io import dumps_fixture, state_to_json, tx_to_json
+
+
+@functools.cache
+def _load_codec() -> Any:
+    """Import tos_codec on first use; ``None`` when it is not installed.
+
+    Cached so a missing module costs one failed import per session rather
+    than one per generated case.
+    """
+    try:
+        import tos_codec
+    except ImportError:
+        return None
+    return tos_codec
 
 
 def _try_wire_hex(tx: Transaction) -> str:
@@ -19,10 +36,10 @@ def _try_wire_hex(tx: Transaction) -> str:
 
     Returns the hex string on success, or empty string on failure.
     """
+    tos_codec = _load_codec()
+    if tos_codec is None:
+        return ""
     try:
-        import tos_codec
-        from tos_spec.codec_adapter import tx_to_serde_json
-
         return tos_codec.encode_tx(tx_to_serde_json(tx))
     except Exception:
         return ""
@@ -41,12 +58,33 @@ def _auto_sign(tx: Transaction) -> None:
         except Exception:
             pass
 
+
+# Collectors below are session-scoped: they only close over these
+# module-level buffers, so one instance serves every test.
 _STATE_CASES: dict[str, list[dict[str, Any]]] = {}
 _WIRE_VECTORS: list[dict[str, Any]] = []
 _VECTOR_CASES: dict[str, list[dict[str, Any]]] = {}
 _ACCOUNTS: list[dict[str, str]] = []
 
 
+def _state_case(name: str, pre_state: ChainState, tx: Transaction) -> dict[str, Any]:
+    """Sign and apply ``tx`` to ``pre_state`` and build the fixture case."""
+    _auto_sign(tx)
+    post_state, result = apply_tx(pre_state, tx)
+    tx_json = tx_to_json(tx)
+    tx_json["wire_hex"] = _try_wire_hex(tx)
+    return {
+        "name": name,
+        "pre_state": state_to_json(pre_state),
+        "tx": tx_json,
+        "expected": {
+            "ok": result.ok,
+            "error": result.error.code.name if result.error else None,
+            "post_state": state_to_json(post_state),
+        },
+    }
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
         "--output",
@@ -56,59 +94,33 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def state_test() -> Callable[[str, ChainState, Transaction], None]:
     """Collect a state transition case and append expected outputs."""
 
     def _state_test(name: str, pre_state: ChainState, tx: Transaction) -> None:
-        _auto_sign(tx)
-        post_state, result = apply_tx(pre_state, tx)
-        tx_json = tx_to_json(tx)
-        tx_json["wire_hex"] = _try_wire_hex(tx)
         _STATE_CASES.setdefault("tx_core.json", []).append(
-            {
-                "name": name,
-                "pre_state": state_to_json(pre_state),
-                "tx": tx_json,
-                "expected": {
-                    "ok": result.ok,
-                    "error": result.error.code.name if result.error else None,
-                    "post_state": state_to_json(post_state),
-                },
-            }
+            _state_case(name, pre_state, tx)
         )
 
     return _state_test
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def state_test_group() -> Callable[[str, str, ChainState, Transaction], None]:
     """Collect a state transition case under a specific fixture path."""
 
     def _state_test_group(
         rel_path: str, name: str, pre_state: ChainState, tx: Transaction
     ) -> None:
-        _auto_sign(tx)
-        post_state, result = apply_tx(pre_state, tx)
-        tx_json = tx_to_json(tx)
-        tx_json["wire_hex"] = _try_wire_hex(tx)
         _STATE_CASES.setdefault(rel_path, []).append(
-            {
-                "name": name,
-                "pre_state": state_to_json(pre_state),
-                "tx": tx_json,
-                "expected": {
-                    "ok": result.ok,
-                    "error": result.error.code.name if result.error else None,
-                    "post_state": state_to_json(post_state),
-                },
-            }
+            _state_case(name, pre_state, tx)
         )
 
     return _state_test_group
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def block_test_group() -> Callable[[str, str, ChainState, list[Transaction]], None]:
     """Collect a block-level (multi-tx) case under a specific fixture path."""
 
@@ -140,7 +152,7 @@ def block_test_group() -> Callable[[str, str, ChainState, list[Transaction]], No
     return _block_test_group
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wire_vector() -> Callable[[str, dict[str, Any]], None]:
     """Collect a wire-format vector case."""
 
@@ -152,7 +164,7 @@ def wire_vector() -> Callable[[str, dict[str, Any]], None]:
     return _wire_vector
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def accounts_collector() -> Callable[[list[dict[str, str]]], None]:
     """Collect deterministic test accounts for output to vectors/accounts.json."""
 
@@ -163,7 +175,7 @@ def accounts_collector() -> Callable[[list[dict[str, str]]], None]:
     return _collect
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vector_test_group() -> Callable[[str, dict[str, Any]], None]:
     """Collect pre-built test_vectors under a specific fixture path."""
 
@@ -173,36 +185,83 @@ def vector_test_group() -> Callable[[str, dict[str, Any]], None]:
     return _vector_test_group
 
 
+def _write_json(target: Path, payload: dict[str, Any], trailer: str = "") -> None:
+    """Write one collected fixture file; called once per file at session end.
+
+    Written to a sibling temp file and renamed into place, so an interrupted
+    run never leaves a truncated fixture behind. A file whose content is
+    already identical is left untouched, keeping its mtime for reruns.
+    """
+    data = dumps_fixture(payload) + trailer.encode()
+    try:
+        if target.stat().st_size == len(data) and target.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+
+
+# Key under which pytest-xdist workers hand their buffers to the controller.
+_WORKER_OUTPUT_KEY = "tos_spec_fixtures"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    """Merge a finished xdist worker's collected cases into this process.
+
+    Every fixture file is owned by a single test module, so with
+    ``--dist loadfile`` each file comes from exactly one worker and keeps
+    its case order.
+    """
+    blob = getattr(node, "workeroutput", {}).get(_WORKER_OUTPUT_KEY)
+    if not blob:
+        return
+    data = json.loads(blob)
+    for rel_path, cases in data["state"].items():
+        _STATE_CASES.setdefault(rel_path, []).extend(cases)
+    _WIRE_VECTORS.extend(data["wire"])
+    for rel_path, vectors in data["vectors"].items():
+        _VECTOR_CASES.setdefault(rel_path, []).extend(vectors)
+    if data["accounts"]:
+        _ACCOUNTS[:] = data["accounts"]
+
+
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     output_dir = session.config.getoption("--output")
     if not output_dir:
         return
 
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # xdist worker: the controller merges and writes everything. JSON keeps
+        # integers wider than 64 bits intact across the execnet channel.
+        workeroutput[_WORKER_OUTPUT_KEY] = json.dumps(
+            {
+                "state": _STATE_CASES,
+                "wire": _WIRE_VECTORS,
+                "vectors": _VECTOR_CASES,
+                "accounts": _ACCOUNTS,
+            }
+        )
+        return
+
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
 
     for rel_path, cases in _STATE_CASES.items():
-        if not cases:
-            continue
-        target = out / rel_path
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(json.dumps({"cases": cases}, indent=2))
+        if cases:
+            _write_json(out / rel_path, {"cases": cases})
 
     if _WIRE_VECTORS:
-        (out / "wire_format.json").write_text(
-            json.dumps({"vectors": _WIRE_VECTORS}, indent=2)
-        )
+        _write_json(out / "wire_format.json", {"vectors": _WIRE_VECTORS})
 
     for rel_path, vectors in _VECTOR_CASES.items():
-        if not vectors:
-            continue
-        target = out / rel_path
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(json.dumps({"test_vectors": vectors}, indent=2))
+        if vectors:
+            _write_json(out / rel_path, {"test_vectors": vectors})
 
     if _ACCOUNTS:
         vectors_dir = Path(__file__).resolve().parent.parent / "vectors"
-        vectors_dir.mkdir(parents=True, exist_ok=True)
-        (vectors_dir / "accounts.json").write_text(
-            json.dumps({"accounts": _ACCOUNTS}, indent=2) + "\n"
-        )
+        _write_json(vectors_dir / "accounts.json", {"accounts": _ACCOUNTS}, "\n")
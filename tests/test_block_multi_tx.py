@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from tos_spec.config import CHAIN_ID_DEVNET
 from tos_spec.test_accounts import ALICE, BOB, CAROL
 from tos_spec.types import (
@@ -15,15 +17,23 @@ from tos_spec.types import (
 )
 from tos_spec.config import EXTRA_DATA_LIMIT_SIZE
 from tos_spec.config import MAX_TRANSFER_COUNT
+from tools.fixtures_io import state_factory
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+
 FEE_MIN = 100_000
 
+# Extra data one byte over the limit, built once at import.
+_OVERSIZED_EXTRA_DATA = b"x" * (EXTRA_DATA_LIMIT_SIZE + 1)
+_OVERSIZED_ZERO_EXTRA_DATA = b"\x00" * (EXTRA_DATA_LIMIT_SIZE + 1)
 
+
+@state_factory
 def _base_state() -> ChainState:
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     state.global_state.block_height = 1
@@ -41,11 +51,11 @@ def _mk_transfer(
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=receiver, amount=amount)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=receiver, amount=amount)],
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -57,11 +67,11 @@ def _mk_transfer_energy_fee(sender: bytes, receiver: bytes, nonce: int, amount:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=receiver, amount=amount)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=receiver, amount=amount)],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -73,11 +83,11 @@ def _mk_burn(sender: bytes, nonce: int, amount: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": amount},
+        payload={"asset": _ZERO_HASH, "amount": amount},
         fee=FEE_MIN,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -182,8 +192,7 @@ def test_block_reject_atomic_on_second_tx_energy_insufficient(block_test_group)
 def test_block_multi_sender_interleaved_success(block_test_group) -> None:
     """Two senders interleaved: strict nonce is tracked per-sender."""
     state = _base_state()
-    state.accounts[BOB].balance = 500_000
-    state.accounts[BOB].nonce = 1
+    state.accounts[BOB] = replace(state.accounts[BOB], balance=500_000, nonce=1)
 
     tx1 = _mk_transfer(ALICE, CAROL, nonce=5, amount=10_000)
     tx2 = _mk_transfer(BOB, CAROL, nonce=1, amount=20_000)
@@ -202,11 +211,11 @@ def _mk_burn(sender: bytes, nonce: int, amount: int, *, fee: int = FEE_MIN) -> T
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": amount},
+        payload={"asset": _ZERO_HASH, "amount": amount},
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -241,9 +250,8 @@ def test_block_reject_sender_not_found(block_test_group) -> None:
 def test_block_energy_fee_consumed_success(block_test_group) -> None:
     """ENERGY fee transfers consume 1 energy each on success."""
     state = _base_state()
-    state.accounts[ALICE].energy = 2
     # ENERGY fee requires fee=0 and still requires balance for transfer amount.
-    state.accounts[ALICE].balance = 1_000_000
+    state.accounts[ALICE] = replace(state.accounts[ALICE], energy=2, balance=1_000_000)
 
     tx1 = _mk_transfer_energy_fee(ALICE, BOB, nonce=5, amount=10_000)
     tx2 = _mk_transfer_energy_fee(ALICE, BOB, nonce=6, amount=10_000)
@@ -258,8 +266,7 @@ def test_block_energy_fee_consumed_success(block_test_group) -> None:
 def test_block_reject_atomic_on_second_tx_insufficient_energy_fee(block_test_group) -> None:
     """Second ENERGY-fee tx fails due to insufficient energy; entire block is rejected."""
     state = _base_state()
-    state.accounts[ALICE].energy = 1
-    state.accounts[ALICE].balance = 1_000_000
+    state.accounts[ALICE] = replace(state.accounts[ALICE], energy=1, balance=1_000_000)
 
     tx1 = _mk_transfer_energy_fee(ALICE, BOB, nonce=5, amount=10_000)
     tx2 = _mk_transfer_energy_fee(ALICE, BOB, nonce=6, amount=10_000)
@@ -287,8 +294,7 @@ def test_block_reject_atomic_rolls_back_recipient_credit(block_test_group) -> No
 def test_block_reject_atomic_on_third_tx_sender_nonce_mismatch(block_test_group) -> None:
     """Failure on the 3rd tx must roll back earlier successful txs."""
     state = _base_state()
-    state.accounts[BOB].balance = 500_000
-    state.accounts[BOB].nonce = 0
+    state.accounts[BOB] = replace(state.accounts[BOB], balance=500_000, nonce=0)
 
     tx1 = _mk_transfer(ALICE, CAROL, nonce=5, amount=10_000)
     tx2 = _mk_transfer(BOB, CAROL, nonce=0, amount=20_000)
@@ -304,8 +310,7 @@ def test_block_reject_atomic_on_third_tx_sender_nonce_mismatch(block_test_group)
 def test_block_multi_sender_success_two_senders(block_test_group) -> None:
     """Two independent senders both succeed in the same block."""
     state = _base_state()
-    state.accounts[BOB].balance = 1_000_000
-    state.accounts[BOB].nonce = 0
+    state.accounts[BOB] = replace(state.accounts[BOB], balance=1_000_000, nonce=0)
 
     tx1 = _mk_transfer(ALICE, CAROL, nonce=5, amount=10_000)
     tx2 = _mk_transfer(BOB, CAROL, nonce=0, amount=20_000)
@@ -320,8 +325,7 @@ def test_block_multi_sender_success_two_senders(block_test_group) -> None:
 def test_block_reject_atomic_on_second_sender_nonce_too_high(block_test_group) -> None:
     """Second tx from a different sender has nonce too high; entire block rejected."""
     state = _base_state()
-    state.accounts[BOB].balance = 1_000_000
-    state.accounts[BOB].nonce = 0
+    state.accounts[BOB] = replace(state.accounts[BOB], balance=1_000_000, nonce=0)
 
     tx1 = _mk_transfer(ALICE, CAROL, nonce=5, amount=10_000)
     tx2 = _mk_transfer(BOB, CAROL, nonce=2, amount=20_000)  # strict nonce expects 0
@@ -337,8 +341,7 @@ def test_block_reject_atomic_on_second_sender_insufficient_balance(block_test_gr
     """Second tx fails insufficient balance (amount+fee); entire block rejected."""
     state = _base_state()
     # Ensure fee is affordable but amount+fee is not.
-    state.accounts[BOB].balance = FEE_MIN
-    state.accounts[BOB].nonce = 0
+    state.accounts[BOB] = replace(state.accounts[BOB], balance=FEE_MIN, nonce=0)
 
     tx1 = _mk_transfer(ALICE, CAROL, nonce=5, amount=10_000)
     tx2 = _mk_transfer(BOB, CAROL, nonce=0, amount=1, fee=FEE_MIN)
@@ -355,8 +358,7 @@ def test_block_reject_atomic_on_energy_fee_nonzero(block_test_group) -> None:
     """ENERGY fee must be zero; violation rejects block and rolls back tx1."""
     state = _base_state()
     # Ensure we hit the fee validation rather than failing earlier on energy.
-    state.accounts[ALICE].energy = 2
-    state.accounts[ALICE].balance = 1_000_000
+    state.accounts[ALICE] = replace(state.accounts[ALICE], energy=2, balance=1_000_000)
 
     tx1 = _mk_transfer(ALICE, BOB, nonce=5, amount=10_000, fee=FEE_MIN)
     tx2 = _mk_transfer_energy_fee(ALICE, BOB, nonce=6, amount=10_000)
@@ -393,16 +395,16 @@ def test_block_reject_atomic_on_second_tx_invalid_transfer_extra_data(block_test
         tx_type=TransactionType.TRANSFERS,
         payload=[
             TransferPayload(
-                asset=_hash(0),
+                asset=_ZERO_HASH,
                 destination=BOB,
                 amount=1,
-                extra_data=b"x" * (EXTRA_DATA_LIMIT_SIZE + 1),
+                extra_data=_OVERSIZED_EXTRA_DATA,
             )
         ],
         fee=FEE_MIN,
         fee_type=FeeType.TOS,
         nonce=6,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -625,7 +627,7 @@ def test_block_additional_coverage(block_test_group) -> None:
     # 11) Invalid transfer extra_data on the first tx
     state = _base_state()
     tx1 = _mk_transfer(ALICE, BOB, nonce=5, amount=1)
-    tx1.payload[0].extra_data = b"\x00" * (EXTRA_DATA_LIMIT_SIZE + 1)
+    tx1.payload[0].extra_data = _OVERSIZED_ZERO_EXTRA_DATA
     tx2 = _mk_transfer(ALICE, BOB, nonce=6, amount=1)
     block_test_group(path, "block_reject_atomic_on_first_tx_invalid_transfer_extra_data", state, [tx1, tx2])
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import partial
 import json
 from pathlib import Path
 
@@ -40,6 +41,7 @@ from tos_spec.types import (
     AgentAccountMeta,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 from tools.fixtures_io import state_to_json
 from tools.fixtures_io import tx_to_json
 
@@ -80,6 +82,10 @@ BLOCK_TIME_TARGET_MS = 1000  # TIP-1: unified to 1s in hard_fork.rs
 DEV_FEE_THRESHOLD_5PCT = 15_768_000
 SIDE_BLOCK_REWARD_PERCENT = 30  # daemon/src/config.rs
 
+# Fixed payload bytes shared by several cases, built once at import.
+_OVERSIZED_EXTRA_DATA = b"x" * (EXTRA_DATA_LIMIT_SIZE + 1)
+_MIN_ELF_MODULE = b"\x7fELF" + b"\x00" * 4
+
 
 def get_block_reward(past_emitted_supply: int) -> int:
     if past_emitted_supply >= MAXIMUM_SUPPLY:
@@ -100,7 +106,7 @@ def apply_empty_block_with_rewards(
     side_reward_percent: int | None = None,
 ) -> tuple[ChainState, int]:
     """Apply an empty block's reward distribution to the exported state surface."""
-    next_state = deepcopy(state)
+    next_state = state.clone()
     # Match daemon: apply dev fee to the pre-divide "base_reward" amount, then divide.
     # This matters across multiple blocks because the right-shift changes base_reward.
     if emitted_supply >= MAXIMUM_SUPPLY:
@@ -127,7 +133,7 @@ def apply_empty_block_with_rewards(
     return next_state, reward
 
 
-def _base_state(include_miner: bool) -> ChainState:
+def _build_base_state(include_miner: bool) -> ChainState:
     s = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     s.global_state = GlobalState(total_supply=0, total_burned=0, total_energy=0, block_height=0, timestamp=0)
     if include_miner:
@@ -135,30 +141,67 @@ def _base_state(include_miner: bool) -> ChainState:
     return s
 
 
+@state_factory
 def _tx_state() -> ChainState:
-    s = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    s.global_state = GlobalState(total_supply=0, total_burned=0, total_energy=0, block_height=0, timestamp=0)
-    s.accounts[MINER] = AccountState(address=MINER, balance=0, nonce=0)
+    s = _build_base_state(include_miner=True)
     s.accounts[ALICE] = AccountState(address=ALICE, balance=1_000_000, nonce=0)
     s.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
     return s
 
 
+@state_factory
+def _energy_fee_state() -> ChainState:
+    """Tx state where ALICE has exactly one unit of energy to pay a fee with."""
+    s = _tx_state()
+    s.energy_resources[ALICE] = EnergyResource(
+        frozen_tos=COIN_VALUE,
+        energy=1,
+        freeze_records=[FreezeRecord(amount=COIN_VALUE, energy_gained=1, freeze_height=0, unlock_height=99999)],
+    )
+    return s
+
+
+_BASE_STATES = {
+    flag: state_factory(partial(_build_base_state, flag)) for flag in (False, True)
+}
+
+
+def _base_state(include_miner: bool) -> ChainState:
+    return _BASE_STATES[include_miner]()
+
+
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+
+# ALICE registered as an agent account controlled by BOB. Shared by the
+# agent-account cases, which only serialize it or hand it to apply_block.
+_REGISTERED_AGENT = AgentAccountMeta(
+    owner=ALICE,
+    controller=BOB,
+    policy_hash=_hash(9),
+    status=0,
+    energy_pool=None,
+    session_key_root=None,
+)
+
+# Payload of the empty UNO/shield/unshield txs; nothing mutates it.
+_EMPTY_TRANSFERS = {"transfers": []}
+
+
 def _mk_transfer(sender: bytes, receiver: bytes, nonce: int, amount: int, fee: int) -> Transaction:
     return Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=receiver, amount=amount)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=receiver, amount=amount)],
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -170,11 +213,11 @@ def _mk_burn(sender: bytes, nonce: int, amount: int, fee: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": amount},
+        payload={"asset": _ZERO_HASH, "amount": amount},
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -190,7 +233,7 @@ def _mk_multisig(sender: bytes, nonce: int, threshold: int, participants: list[b
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -206,7 +249,7 @@ def _mk_agent_account(sender: bytes, nonce: int, payload: dict, fee: int) -> Tra
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -226,7 +269,7 @@ def _mk_energy_freeze(sender: bytes, nonce: int, amount: int, days: int, fee: in
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -248,7 +291,7 @@ def _mk_energy_delegate(
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -264,7 +307,7 @@ def _mk_deploy_contract(sender: bytes, nonce: int, module: bytes, fee: int) -> T
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -286,7 +329,7 @@ def _mk_invoke_contract(sender: bytes, nonce: int, contract: bytes, entry_id: in
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -302,7 +345,7 @@ def _mk_register_name(sender: bytes, nonce: int, name: str, fee: int) -> Transac
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -314,11 +357,11 @@ def _mk_uno_empty(sender: bytes, nonce: int, fee: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.UNO_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=fee,
         fee_type=FeeType.UNO,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -330,11 +373,11 @@ def _mk_shield_empty(sender: bytes, nonce: int, fee: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.SHIELD_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -346,11 +389,11 @@ def _mk_unshield_empty(sender: bytes, nonce: int, fee: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.UNSHIELD_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -362,11 +405,11 @@ def _mk_transfer_energy_fee(sender: bytes, receiver: bytes, nonce: int, amount:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=receiver, amount=amount)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=receiver, amount=amount)],
         fee=fee,
         fee_type=FeeType.ENERGY,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -387,7 +430,7 @@ def _mk_energy_unfreeze(sender: bytes, nonce: int, amount: int, fee: int) -> Tra
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -403,7 +446,7 @@ def _mk_energy_withdraw(sender: bytes, nonce: int, fee: int) -> Transaction:
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -421,7 +464,7 @@ def _mk_uno_transfer(sender: bytes, nonce: int, fee: int, transfers: list[dict])
         nonce=nonce,
         source_commitments=[bytes(32)],
         range_proof=bytes(64),
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -437,7 +480,7 @@ def _mk_shield_transfer(sender: bytes, nonce: int, fee: int, transfers: list[dic
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -453,7 +496,7 @@ def _mk_unshield_transfer(sender: bytes, nonce: int, fee: int, transfers: list[d
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -461,7 +504,7 @@ def _mk_unshield_transfer(sender: bytes, nonce: int, fee: int, transfers: list[d
 
 def _privacy_uno_transfer(destination: bytes) -> dict:
     return {
-        "asset": _hash(0),
+        "asset": _ZERO_HASH,
         "destination": destination,
         "extra_data": None,
         "commitment": bytes(32),
@@ -473,7 +516,7 @@ def _privacy_uno_transfer(destination: bytes) -> dict:
 
 def _privacy_shield_transfer(destination: bytes, amount: int) -> dict:
     return {
-        "asset": _hash(0),
+        "asset": _ZERO_HASH,
         "destination": destination,
         "amount": amount,
         "extra_data": None,
@@ -485,7 +528,7 @@ def _privacy_shield_transfer(destination: bytes, amount: int) -> dict:
 
 def _privacy_unshield_transfer(destination: bytes, amount: int) -> dict:
     return {
-        "asset": _hash(0),
+        "asset": _ZERO_HASH,
         "destination": destination,
         "amount": amount,
         "extra_data": None,
@@ -3385,12 +3428,12 @@ def test_chain_block_with_transfer_fee_insufficient_prioritizes_fee(vector_test_
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
         payload=[
-            TransferPayload(asset=_hash(0), destination=BOB, amount=100_000, extra_data=b"x" * (EXTRA_DATA_LIMIT_SIZE + 1)),
+            TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=100_000, extra_data=_OVERSIZED_EXTRA_DATA),
         ],
         fee=1_000_000,
         fee_type=FeeType.TOS,
         nonce=0,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -3573,13 +3616,7 @@ def test_chain_fee_model_transfer_fee_zero_allowed(vector_test_group) -> None:
 
 def test_chain_energy_fee_consumes_energy(vector_test_group) -> None:
     """ENERGY fee should consume energy from EnergyResource on success."""
-    pre = _tx_state()
-    pre.accounts[ALICE].energy = 0
-    pre.energy_resources[ALICE] = EnergyResource(
-        frozen_tos=COIN_VALUE,
-        energy=1,
-        freeze_records=[FreezeRecord(amount=COIN_VALUE, energy_gained=1, freeze_height=0, unlock_height=99999)],
-    )
+    pre = _energy_fee_state()
     pre_json = state_to_json(pre)
 
     tx = _mk_transfer_energy_fee(ALICE, BOB, nonce=0, amount=10_000, fee=0)
@@ -3719,7 +3756,7 @@ def test_chain_contract_deploy_insufficient_balance_rejected(vector_test_group)
     pre.accounts[ALICE].balance = BURN_PER_CONTRACT + 100_000 - 1
     pre_json = state_to_json(pre)
 
-    module = b"\x7fELF" + b"\x00" * 4
+    module = _MIN_ELF_MODULE
     deploy = _mk_deploy_contract(ALICE, nonce=0, module=module, fee=100_000)
 
     _vector_test_group(vector_test_group)(
@@ -3742,13 +3779,7 @@ def test_chain_contract_deploy_insufficient_balance_rejected(vector_test_group)
 
 def test_chain_privacy_uno_energy_fee_success(vector_test_group) -> None:
     """UNO transfer with ENERGY fee succeeds when energy available."""
-    pre = _tx_state()
-    pre.accounts[ALICE].energy = 0
-    pre.energy_resources[ALICE] = EnergyResource(
-        frozen_tos=COIN_VALUE,
-        energy=1,
-        freeze_records=[FreezeRecord(amount=COIN_VALUE, energy_gained=1, freeze_height=0, unlock_height=99999)],
-    )
+    pre = _energy_fee_state()
     pre_json = state_to_json(pre)
 
     tx = Transaction(
@@ -3762,7 +3793,7 @@ def test_chain_privacy_uno_energy_fee_success(vector_test_group) -> None:
         nonce=0,
         source_commitments=[bytes(32)],
         range_proof=bytes(64),
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -3830,14 +3861,7 @@ def test_chain_tns_register_duplicate_rejected(vector_test_group) -> None:
 def test_chain_agent_account_set_status_invalid_rejected(vector_test_group) -> None:
     """Agent account set_status with invalid status should be rejected."""
     pre = _tx_state()
-    pre.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(9),
-        status=0,
-        energy_pool=None,
-        session_key_root=None,
-    )
+    pre.agent_accounts[ALICE] = _REGISTERED_AGENT
     pre_json = state_to_json(pre)
 
     tx = _mk_agent_account(ALICE, nonce=0, payload={"variant": "set_status", "status": 2}, fee=100_000)
@@ -4146,7 +4170,7 @@ def test_chain_contract_deploy_then_invoke_success(vector_test_group) -> None:
     pre.accounts[ALICE].balance = BURN_PER_CONTRACT + 5 * COIN_VALUE
     pre_json = state_to_json(pre)
 
-    module = b"\x7fELF" + b"\x00" * 4
+    module = _MIN_ELF_MODULE
     deploy = _mk_deploy_contract(ALICE, nonce=0, module=module, fee=100_000)
     contract_hash = blake3(module).digest()
     invoke = _mk_invoke_contract(ALICE, nonce=1, contract=contract_hash, entry_id=0, max_gas=1_000_000, fee=100_000)
@@ -4434,14 +4458,7 @@ def test_chain_agent_account_register_then_update(vector_test_group) -> None:
 def test_chain_agent_account_rotate_same_controller_rejected(vector_test_group) -> None:
     """Rotate controller to same value should be rejected."""
     pre = _tx_state()
-    pre.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(9),
-        status=0,
-        energy_pool=None,
-        session_key_root=None,
-    )
+    pre.agent_accounts[ALICE] = _REGISTERED_AGENT
     pre_json = state_to_json(pre)
 
     rotate = _mk_agent_account(
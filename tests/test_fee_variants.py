@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
+import pytest
 import tos_signer
 from tos_spec.config import CHAIN_ID_DEVNET, COIN_VALUE, MIN_SHIELD_TOS_AMOUNT
 from tos_spec.test_accounts import ALICE, BOB
@@ -18,18 +21,47 @@ from tos_spec.types import (
     TransferPayload,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
+
+# COIN_VALUE multiples, computed once at import.
+_BASE_BALANCE = 10 * COIN_VALUE
+_FROZEN_TOS = 100 * COIN_VALUE
+_LARGE_BALANCE = 1000 * COIN_VALUE
+_OVER_BALANCE_FEE = 20 * COIN_VALUE  # exceeds _BASE_BALANCE
+
+# Shared freeze duration for the energy cases; payloads are never mutated.
+_FREEZE_7_DAYS = FreezeDuration(days=7)
 
 
 def _hash(n: int) -> bytes:
     return bytes([n]) + bytes(31)
 
 
-def _base_state() -> ChainState:
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    state.accounts[ALICE] = AccountState(
-        address=ALICE, balance=10 * COIN_VALUE, nonce=5
+_ZERO_HASH = _hash(0)
+
+# Shared payloads; like _FREEZE_7_DAYS, nothing mutates them.
+_BOB_TRANSFER = TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=100_000)
+_BOB_HALF_TRANSFER = TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=50_000)
+_BURN_PAYLOAD = {"asset": _ZERO_HASH, "amount": 100_000}
+_FREEZE_PAYLOAD = EnergyPayload(variant="freeze_tos", amount=COIN_VALUE, duration=_FREEZE_7_DAYS)
+
+
+@state_factory
+def _default_state() -> ChainState:
+    return ChainState(
+        network_chain_id=CHAIN_ID_DEVNET,
+        accounts={
+            ALICE: AccountState(address=ALICE, balance=_BASE_BALANCE, nonce=5),
+            BOB: AccountState(address=BOB, balance=0, nonce=0),
+        },
     )
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+
+
+def _base_state(**alice) -> ChainState:
+    """Fresh base state; keyword arguments override ALICE's account fields."""
+    state = _default_state()
+    if alice:
+        state.accounts[ALICE] = replace(state.accounts[ALICE], **alice)
     return state
 
 
@@ -48,6 +80,18 @@ def _valid_ct_proof() -> bytes:
     return bytes(tos_signer.make_dummy_ct_validity_proof())
 
 
+def _uno_transfer_entry() -> dict:
+    """One UNO transfer to BOB with fresh ciphertext points and proof."""
+    return {
+        "asset": _ZERO_HASH,
+        "destination": BOB,
+        "commitment": _valid_point(),
+        "sender_handle": _valid_point(),
+        "receiver_handle": _valid_point(),
+        "ct_validity_proof": _valid_ct_proof(),
+    }
+
+
 def _mk_energy_resource(*, frozen_tos: int, energy: int) -> EnergyResource:
     # Keep a freeze record so daemon export/digest stays consistent with energy_resources.
     return EnergyResource(
@@ -64,6 +108,13 @@ def _mk_energy_resource(*, frozen_tos: int, energy: int) -> EnergyResource:
     )
 
 
+def _frozen_energy_state(energy: int, **alice) -> ChainState:
+    """Base state with ALICE holding _FROZEN_TOS frozen and ``energy`` energy."""
+    state = _base_state(frozen=_FROZEN_TOS, energy=energy, **alice)
+    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=_FROZEN_TOS, energy=energy)
+    return state
+
+
 # ===================================================================
 # Group 1: Wrong fee_type tests
 # ===================================================================
@@ -75,26 +126,21 @@ def test_transfer_energy_fee_zero(state_test_group) -> None:
     Daemon computes energy cost from wire size. Sender needs enough
     frozen TOS to have sufficient energy for the transaction.
     """
-    state = _base_state()
     # Give ALICE frozen TOS so she has energy for the tx
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.energy_resources[ALICE] = EnergyResource(
-        frozen_tos=100 * COIN_VALUE, energy=1_000_000,
-        freeze_records=[FreezeRecord(
-            amount=100 * COIN_VALUE, energy_gained=1_000_000,
-            freeze_height=0, unlock_height=99999,
-        )],
+    state = _base_state(frozen=_FROZEN_TOS)
+    state.energy_resources[ALICE] = _mk_energy_resource(
+        frozen_tos=_FROZEN_TOS, energy=1_000_000
     )
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -114,11 +160,11 @@ def test_transfer_energy_fee_nonzero(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=100_000,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -132,21 +178,18 @@ def test_transfer_energy_fee_nonzero(state_test_group) -> None:
 
 def test_transfer_energy_fee_insufficient_energy(state_test_group) -> None:
     """TRANSFERS with FeeType.ENERGY but insufficient energy must fail."""
-    state = _base_state()
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.accounts[ALICE].energy = 0
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=0)
+    state = _frozen_energy_state(0)
 
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -160,21 +203,18 @@ def test_transfer_energy_fee_insufficient_energy(state_test_group) -> None:
 
 def test_transfer_energy_fee_consumes_one(state_test_group) -> None:
     """TRANSFERS with FeeType.ENERGY consumes exactly 1 energy on success."""
-    state = _base_state()
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.accounts[ALICE].energy = 1
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=1)
+    state = _frozen_energy_state(1)
 
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -188,19 +228,18 @@ def test_transfer_energy_fee_consumes_one(state_test_group) -> None:
 
 def test_transfer_energy_fee_uses_account_energy(state_test_group) -> None:
     """ENERGY fee uses AccountState.energy when no EnergyResource is present."""
-    state = _base_state()
-    state.accounts[ALICE].energy = 1
+    state = _base_state(energy=1)
 
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -214,20 +253,19 @@ def test_transfer_energy_fee_uses_account_energy(state_test_group) -> None:
 
 def test_transfer_energy_fee_prefers_energy_resource(state_test_group) -> None:
     """ENERGY fee uses EnergyResource when present (over AccountState.energy)."""
-    state = _base_state()
-    state.accounts[ALICE].energy = 0
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=1)
+    state = _base_state(energy=0)
+    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=_FROZEN_TOS, energy=1)
 
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -241,8 +279,7 @@ def test_transfer_energy_fee_prefers_energy_resource(state_test_group) -> None:
 
 def test_transfer_energy_fee_multi_output_cost_one(state_test_group) -> None:
     """ENERGY fee cost is 1 even with multiple outputs."""
-    state = _base_state()
-    state.accounts[ALICE].energy = 1
+    state = _base_state(energy=1)
 
     tx = Transaction(
         version=TxVersion.T1,
@@ -250,13 +287,13 @@ def test_transfer_energy_fee_multi_output_cost_one(state_test_group) -> None:
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
         payload=[
-            TransferPayload(asset=_hash(0), destination=BOB, amount=50_000),
-            TransferPayload(asset=_hash(0), destination=BOB, amount=50_000),
+            _BOB_HALF_TRANSFER,
+            _BOB_HALF_TRANSFER,
         ],
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -270,11 +307,7 @@ def test_transfer_energy_fee_multi_output_cost_one(state_test_group) -> None:
 
 def test_shield_energy_fee_zero(state_test_group) -> None:
     """SHIELD_TRANSFERS with FeeType.ENERGY must fail (Energy fee type is Transfers-only)."""
-    state = _base_state()
-    state.accounts[ALICE].balance = 1000 * COIN_VALUE
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.accounts[ALICE].energy = 10
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=10)
+    state = _frozen_energy_state(10, balance=_LARGE_BALANCE)
 
     amount = MIN_SHIELD_TOS_AMOUNT
     commitment, receiver_handle, proof = [
@@ -288,7 +321,7 @@ def test_shield_energy_fee_zero(state_test_group) -> None:
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": BOB,
                     "amount": amount,
                     "commitment": commitment,
@@ -301,7 +334,7 @@ def test_shield_energy_fee_zero(state_test_group) -> None:
         fee_type=FeeType.ENERGY,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -315,11 +348,7 @@ def test_shield_energy_fee_zero(state_test_group) -> None:
 
 def test_unshield_energy_fee_zero(state_test_group) -> None:
     """UNSHIELD_TRANSFERS with FeeType.ENERGY must fail (Energy fee type is Transfers-only)."""
-    state = _base_state()
-    state.accounts[ALICE].balance = 1000 * COIN_VALUE
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.accounts[ALICE].energy = 10
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=10)
+    state = _frozen_energy_state(10, balance=_LARGE_BALANCE)
 
     tx = Transaction(
         version=TxVersion.T1,
@@ -329,7 +358,7 @@ def test_unshield_energy_fee_zero(state_test_group) -> None:
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": BOB,
                     "amount": 5 * COIN_VALUE,
                     "commitment": _valid_point(),
@@ -342,7 +371,7 @@ def test_unshield_energy_fee_zero(state_test_group) -> None:
         fee_type=FeeType.ENERGY,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -356,33 +385,19 @@ def test_unshield_energy_fee_zero(state_test_group) -> None:
 
 def test_uno_energy_fee_zero(state_test_group) -> None:
     """UNO_TRANSFERS with FeeType.ENERGY must fail (Energy fee type is Transfers-only)."""
-    state = _base_state()
-    state.accounts[ALICE].frozen = 100 * COIN_VALUE
-    state.accounts[ALICE].energy = 10
-    state.energy_resources[ALICE] = _mk_energy_resource(frozen_tos=100 * COIN_VALUE, energy=10)
+    state = _frozen_energy_state(10)
 
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.UNO_TRANSFERS,
-        payload={
-            "transfers": [
-                {
-                    "asset": _hash(0),
-                    "destination": BOB,
-                    "commitment": _valid_point(),
-                    "sender_handle": _valid_point(),
-                    "receiver_handle": _valid_point(),
-                    "ct_validity_proof": _valid_ct_proof(),
-                }
-            ]
-        },
+        payload={"transfers": [_uno_transfer_entry()]},
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -394,208 +409,68 @@ def test_uno_energy_fee_zero(state_test_group) -> None:
     )
 
 
-def test_burn_energy_fee(state_test_group) -> None:
-    """BURN with FeeType.ENERGY — should FAIL: INVALID_PAYLOAD (energy fee only for transfers)."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": 100_000},
-        fee=0,
-        fee_type=FeeType.ENERGY,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "burn_energy_fee",
-        state,
-        tx,
-    )
-
-
-def test_burn_uno_fee(state_test_group) -> None:
-    """BURN with FeeType.UNO — should FAIL: INVALID_PAYLOAD (uno fee only for uno_transfers)."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": 100_000},
-        fee=0,
-        fee_type=FeeType.UNO,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "burn_uno_fee",
-        state,
-        tx,
-    )
-
-
-def test_freeze_energy_fee(state_test_group) -> None:
-    """ENERGY (freeze) with FeeType.ENERGY and fee=0 — should FAIL: energy fee only for transfers."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.ENERGY,
-        payload=EnergyPayload(
-            variant="freeze_tos",
-            amount=COIN_VALUE,
-            duration=FreezeDuration(days=7),
-        ),
-        fee=0,
-        fee_type=FeeType.ENERGY,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "freeze_energy_fee",
-        state,
-        tx,
-    )
-
-
-def test_freeze_uno_fee(state_test_group) -> None:
-    """ENERGY (freeze) with FeeType.UNO — should FAIL: uno fee only for uno_transfers."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.ENERGY,
-        payload=EnergyPayload(
-            variant="freeze_tos",
-            amount=COIN_VALUE,
-            duration=FreezeDuration(days=7),
-        ),
-        fee=0,
-        fee_type=FeeType.UNO,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "freeze_uno_fee",
-        state,
-        tx,
-    )
-
-
-def test_contract_energy_fee(state_test_group) -> None:
-    """DEPLOY_CONTRACT with FeeType.ENERGY — should FAIL: INVALID_PAYLOAD."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.DEPLOY_CONTRACT,
-        payload={"module": b"\x7FELF" + b"\x00" * 100},
-        fee=0,
-        fee_type=FeeType.ENERGY,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
+# (case name, tx type, payload, fee type): txs paying with a fee type they do
+# not support, all with fee=0 from the base state. ENERGY fees are for
+# transfer-type txs only and UNO fees for uno_transfers only; each row notes
+# the error it must fail with.
+_WRONG_FEE_TYPE_CASES = [
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    ("burn_energy_fee", TransactionType.BURN, _BURN_PAYLOAD, FeeType.ENERGY),
+    # INVALID_FORMAT: uno fee only for uno_transfers
+    ("burn_uno_fee", TransactionType.BURN, _BURN_PAYLOAD, FeeType.UNO),
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    ("freeze_energy_fee", TransactionType.ENERGY, _FREEZE_PAYLOAD, FeeType.ENERGY),
+    # INVALID_FORMAT: uno fee only for uno_transfers
+    ("freeze_uno_fee", TransactionType.ENERGY, _FREEZE_PAYLOAD, FeeType.UNO),
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    (
         "contract_energy_fee",
-        state,
-        tx,
-    )
-
-
-def test_tns_energy_fee(state_test_group) -> None:
-    """REGISTER_NAME with FeeType.ENERGY — should FAIL: INVALID_PAYLOAD."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.REGISTER_NAME,
-        payload={"name": "alice"},
-        fee=0,
-        fee_type=FeeType.ENERGY,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "tns_energy_fee",
-        state,
-        tx,
-    )
-
-
-def test_multisig_energy_fee(state_test_group) -> None:
-    """MULTISIG with FeeType.ENERGY — should FAIL: INVALID_PAYLOAD."""
-    state = _base_state()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.MULTISIG,
-        payload={"threshold": 2, "participants": [BOB]},
-        fee=0,
-        fee_type=FeeType.ENERGY,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
-    state_test_group(
-        "transactions/fee_variants.json",
+        TransactionType.DEPLOY_CONTRACT,
+        {"module": b"\x7FELF" + b"\x00" * 100},
+        FeeType.ENERGY,
+    ),
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    ("tns_energy_fee", TransactionType.REGISTER_NAME, {"name": "alice"}, FeeType.ENERGY),
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    (
         "multisig_energy_fee",
-        state,
-        tx,
-    )
+        TransactionType.MULTISIG,
+        {"threshold": 2, "participants": [BOB]},
+        FeeType.ENERGY,
+    ),
+    # INVALID_FORMAT: energy fee only for transfer-type txs
+    (
+        "agent_account_energy_fee",
+        TransactionType.AGENT_ACCOUNT,
+        {"variant": "create", "controller": BOB, "policy_hash": _hash(1)},
+        FeeType.ENERGY,
+    ),
+]
 
 
-def test_agent_account_energy_fee(state_test_group) -> None:
-    """AGENT_ACCOUNT with FeeType.ENERGY — should FAIL: INVALID_PAYLOAD."""
+@pytest.mark.parametrize(
+    ("case", "tx_type", "payload", "fee_type"),
+    _WRONG_FEE_TYPE_CASES,
+    ids=[c[0] for c in _WRONG_FEE_TYPE_CASES],
+)
+def test_wrong_fee_type(
+    state_test_group, case: str, tx_type: TransactionType, payload: object, fee_type: FeeType
+) -> None:
     state = _base_state()
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
-        tx_type=TransactionType.AGENT_ACCOUNT,
-        payload={
-            "variant": "create",
-            "controller": BOB,
-            "policy_hash": _hash(1),
-        },
+        tx_type=tx_type,
+        payload=payload,
         fee=0,
-        fee_type=FeeType.ENERGY,
+        fee_type=fee_type,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
-    state_test_group(
-        "transactions/fee_variants.json",
-        "agent_account_energy_fee",
-        state,
-        tx,
-    )
+    state_test_group("transactions/fee_variants.json", case, state, tx)
 
 
 # ===================================================================
@@ -611,11 +486,11 @@ def test_transfer_negative_fee(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[_BOB_TRANSFER],
         fee=-1,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -635,11 +510,11 @@ def test_transfer_insufficient_fee(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
-        fee=20 * COIN_VALUE,
+        payload=[_BOB_TRANSFER],
+        fee=_OVER_BALANCE_FEE,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -659,11 +534,11 @@ def test_burn_negative_fee(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": 100_000},
+        payload=_BURN_PAYLOAD,
         fee=-1,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -683,15 +558,11 @@ def test_freeze_insufficient_fee(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.ENERGY,
-        payload=EnergyPayload(
-            variant="freeze_tos",
-            amount=COIN_VALUE,
-            duration=FreezeDuration(days=7),
-        ),
-        fee=20 * COIN_VALUE,
+        payload=_FREEZE_PAYLOAD,
+        fee=_OVER_BALANCE_FEE,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -711,30 +582,17 @@ def test_freeze_insufficient_fee(state_test_group) -> None:
 def test_uno_transfer_tos_fee(state_test_group) -> None:
     """UNO_TRANSFERS with FeeType.TOS — should succeed (TOS fee always allowed)."""
     state = _base_state()
-    _vp = lambda: bytes(tos_signer.random_valid_point())
-    _ct = lambda: bytes(tos_signer.make_dummy_ct_validity_proof())
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.UNO_TRANSFERS,
-        payload={
-            "transfers": [
-                {
-                    "asset": _hash(0),
-                    "destination": BOB,
-                    "commitment": _vp(),
-                    "sender_handle": _vp(),
-                    "receiver_handle": _vp(),
-                    "ct_validity_proof": _ct(),
-                }
-            ]
-        },
+        payload={"transfers": [_uno_transfer_entry()]},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -749,30 +607,17 @@ def test_uno_transfer_tos_fee(state_test_group) -> None:
 def test_uno_transfer_uno_fee_nonzero(state_test_group) -> None:
     """UNO_TRANSFERS with FeeType.UNO and fee=100 — should FAIL: uno fee must be zero."""
     state = _base_state()
-    _vp = lambda: bytes(tos_signer.random_valid_point())
-    _ct = lambda: bytes(tos_signer.make_dummy_ct_validity_proof())
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.UNO_TRANSFERS,
-        payload={
-            "transfers": [
-                {
-                    "asset": _hash(0),
-                    "destination": BOB,
-                    "commitment": _vp(),
-                    "sender_handle": _vp(),
-                    "receiver_handle": _vp(),
-                    "ct_validity_proof": _ct(),
-                }
-            ]
-        },
+        payload={"transfers": [_uno_transfer_entry()]},
         fee=100,
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -0,0 +1,33 @@
+"""dumps_fixture must match the stdlib byte for byte, with or without orjson."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tools.fixtures_io import dumps_fixture
+
+# (id, payload)
+_PAYLOADS = [
+    ("control_chars", {"a": "\x00\x01\x1f\b\f\n\r\t"}),
+    ("del", {"a": "\x7f"}),
+    ("quotes_and_slashes", {"a": "\"\\/"}),
+    ("non_ascii", {"a": "café ☃"}),
+    ("int_over_u64", {"a": 2**64}),
+    ("int_under_i64", {"a": -(2**63) - 1}),
+    ("int_u64_max", {"a": 2**64 - 1}),
+    ("empty_dict", {}),
+    ("empty_nested", {"a": {}, "b": [], "c": [{}, []]}),
+    ("scalars", {"a": [True, False, None, 0, -1, "x"]}),
+    ("float", {"a": 1e16}),
+]
+
+
+@pytest.mark.parametrize(
+    ("case", "payload"),
+    _PAYLOADS,
+    ids=[c[0] for c in _PAYLOADS],
+)
+def test_dumps_fixture_matches_stdlib(case: str, payload: dict) -> None:
+    assert dumps_fixture(payload) == json.dumps(payload, indent=2).encode()
@@ -0,0 +1,168 @@
+"""ChainState.clone() must stay equivalent to deepcopy as the schema grows."""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+from copy import deepcopy
+
+from tos_spec import types
+from tos_spec.types import (
+    AccountState,
+    AgentAccountMeta,
+    ChainState,
+    ContractState,
+    DelegatedFreezeRecord,
+    EnergyResource,
+    FreezeRecord,
+    GlobalState,
+    MultisigConfig,
+    PendingUnfreeze,
+    TnsRecord,
+)
+
+# Plain addresses; the checks below never sign anything.
+ALICE = bytes([2]) * 32
+BOB = bytes([3]) * 32
+CAROL = bytes([4]) * 32
+
+
+def _populated_state() -> ChainState:
+    """A state in which every field of every record differs from its default."""
+    return ChainState(
+        accounts={
+            ALICE: AccountState(
+                address=ALICE,
+                balance=1_000,
+                nonce=5,
+                frozen=300,
+                energy=42,
+                flags=1,
+                data=b"\x01",
+            )
+        },
+        global_state=GlobalState(
+            total_supply=10_000,
+            total_burned=7,
+            total_energy=42,
+            block_height=3,
+            timestamp=1_700_000_000,
+        ),
+        network_chain_id=3,
+        multisig_configs={ALICE: MultisigConfig(threshold=2, participants=[BOB, CAROL])},
+        agent_accounts={
+            ALICE: AgentAccountMeta(
+                owner=ALICE,
+                controller=BOB,
+                policy_hash=bytes([9]) * 32,
+                status=1,
+                energy_pool=CAROL,
+                session_key_root=bytes([8]) * 32,
+            )
+        },
+        tns_names={"alice": TnsRecord(name="alice", owner=ALICE, registered_at=2)},
+        tns_by_owner={ALICE: "alice"},
+        contracts={
+            bytes([7]) * 32: ContractState(
+                deployer=ALICE,
+                module_hash=bytes([6]) * 32,
+                module=b"\x7fELF",
+                storage={b"k": b"v"},
+            )
+        },
+        energy_resources={
+            ALICE: EnergyResource(
+                freeze_records=[
+                    FreezeRecord(
+                        amount=100, energy_gained=14, freeze_height=1, unlock_height=99
+                    )
+                ],
+                delegated_records=[
+                    DelegatedFreezeRecord(
+                        delegatee=BOB,
+                        amount=200,
+                        energy_gained=28,
+                        freeze_height=1,
+                        unlock_height=99,
+                    )
+                ],
+                pending_unfreezes=[
+                    PendingUnfreeze(amount=50, from_delegation=True, expire_height=10)
+                ],
+                frozen_tos=300,
+                energy=42,
+            )
+        },
+    )
+
+
+def _records(state: ChainState) -> list[object]:
+    """Every record instance reachable from ``state``, including ``state``."""
+    energy = state.energy_resources[ALICE]
+    return [
+        state,
+        state.accounts[ALICE],
+        state.global_state,
+        state.multisig_configs[ALICE],
+        state.agent_accounts[ALICE],
+        state.tns_names["alice"],
+        next(iter(state.contracts.values())),
+        energy,
+        energy.freeze_records[0],
+        energy.delegated_records[0],
+        energy.pending_unfreezes[0],
+    ]
+
+
+def _default(f: dataclasses.Field) -> object:
+    if f.default_factory is not dataclasses.MISSING:
+        return f.default_factory()
+    return f.default
+
+
+def test_clone_matches_deepcopy() -> None:
+    state = _populated_state()
+    assert state.clone() == deepcopy(state)
+
+
+def test_clone_covers_every_field() -> None:
+    records = _records(_populated_state())
+    cloneable = {
+        cls
+        for _, cls in inspect.getmembers(types, inspect.isclass)
+        if dataclasses.is_dataclass(cls) and hasattr(cls, "clone")
+    }
+    # A new record type with clone() must be added to the populated state.
+    assert cloneable == {type(r) for r in records}
+
+    for record in records:
+        copy = record.clone()
+        assert type(copy) is type(record)
+        for f in dataclasses.fields(record):
+            value = getattr(record, f.name)
+            # Guards the fixture: a field left at its default would let a
+            # clone() that forgets it pass unnoticed.
+            assert value != _default(f), f"{type(record).__name__}.{f.name}"
+            assert getattr(copy, f.name) == value, f"{type(record).__name__}.{f.name}"
+            if isinstance(value, (dict, list)) or dataclasses.is_dataclass(value):
+                assert getattr(copy, f.name) is not value, (
+                    f"{type(record).__name__}.{f.name} is shared with the clone"
+                )
+
+
+def test_clone_is_independent() -> None:
+    state = _populated_state()
+    before = deepcopy(state)
+    copy = state.clone()
+
+    for record in _records(copy):
+        for f in dataclasses.fields(record):
+            value = getattr(record, f.name)
+            if isinstance(value, (dict, list)):
+                value.clear()
+            elif isinstance(value, bool):
+                setattr(record, f.name, not value)
+            elif isinstance(value, int):
+                setattr(record, f.name, value + 1)
+
+    assert state == before
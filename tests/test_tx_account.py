@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
+import pytest
+
 from tos_spec.config import CHAIN_ID_DEVNET, MAX_MULTISIG_PARTICIPANTS
 from tos_spec.test_accounts import ALICE, BOB, CAROL, DAVE
 from tos_spec.types import (
@@ -13,52 +17,89 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
+
+MULTISIG_PATH = "transactions/account/multisig.json"
+AGENT_ACCOUNT_PATH = "transactions/account/agent_account.json"
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_REFERENCE_HASH = _hash(0)
+_POLICY_HASH = _hash(3)
+_NEW_POLICY_HASH = _hash(4)
+_SESSION_KEY_ROOT = _hash(9)
+
+# Default agent_account.register payload, passed as is by tests that use it
+# unchanged. Tests that override a field copy it, so it is never mutated.
+_REGISTER_PAYLOAD = {
+    "variant": "register",
+    "controller": BOB,
+    "policy_hash": _POLICY_HASH,
+}
+
+# ALICE registered as an agent account controlled by BOB. Shared by the tests
+# that need a registered account: apply_tx never mutates its pre-state.
+_REGISTERED_AGENT = AgentAccountMeta(
+    owner=ALICE,
+    controller=BOB,
+    policy_hash=_POLICY_HASH,
+    status=0,
+)
+
+
+@state_factory
 def _base_state() -> ChainState:
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    state.accounts[ALICE] = AccountState(address=ALICE, balance=1_000_000, nonce=5)
+    return ChainState(
+        network_chain_id=CHAIN_ID_DEVNET,
+        accounts={ALICE: AccountState(address=ALICE, balance=1_000_000, nonce=5)},
+    )
+
+
+def _registered_state(**overrides) -> ChainState:
+    """Base state with ALICE registered as an agent account."""
+    state = _base_state()
+    agent = replace(_REGISTERED_AGENT, **overrides) if overrides else _REGISTERED_AGENT
+    state.agent_accounts[ALICE] = agent
     return state
 
 
-def _mk_multisig(
-    sender: bytes, nonce: int, threshold: int, participants: list[bytes], fee: int
+def _mk_account_tx(
+    tx_type: TransactionType, payload: dict, sender: bytes, nonce: int, fee: int
 ) -> Transaction:
     return Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
-        tx_type=TransactionType.MULTISIG,
-        payload={"threshold": threshold, "participants": participants},
+        tx_type=tx_type,
+        payload=payload,
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
+def _mk_multisig(
+    threshold: int,
+    participants: list[bytes],
+    *,
+    sender: bytes = ALICE,
+    nonce: int = 5,
+    fee: int = 100_000,
+) -> Transaction:
+    payload = {"threshold": threshold, "participants": participants}
+    return _mk_account_tx(TransactionType.MULTISIG, payload, sender, nonce, fee)
+
+
 def _mk_agent_account(
-    sender: bytes, nonce: int, payload: dict, fee: int
+    payload: dict, *, sender: bytes = ALICE, nonce: int = 5, fee: int = 100_000
 ) -> Transaction:
-    return Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=sender,
-        tx_type=TransactionType.AGENT_ACCOUNT,
-        payload=payload,
-        fee=fee,
-        fee_type=FeeType.TOS,
-        nonce=nonce,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    return _mk_account_tx(TransactionType.AGENT_ACCOUNT, payload, sender, nonce, fee)
 
 
 # --- multisig specs ---
@@ -67,9 +108,12 @@ def _mk_agent_account(
 def test_multisig_setup(state_test_group) -> None:
     state = _base_state()
     participants = [BOB, bytes([3]) * 32, bytes([4]) * 32]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=2, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=2, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json", "multisig_setup", state, tx
+        MULTISIG_PATH,
+        "multisig_setup",
+        state,
+        tx,
     )
 
 
@@ -78,9 +122,9 @@ def test_multisig_insufficient_fee(state_test_group) -> None:
     state = _base_state()
     state.accounts[ALICE].balance = 99_999
     participants = [BOB, bytes([3]) * 32, bytes([4]) * 32]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=2, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=2, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_insufficient_fee",
         state,
         tx,
@@ -92,9 +136,9 @@ def test_multisig_exact_balance_for_fee(state_test_group) -> None:
     state = _base_state()
     state.accounts[ALICE].balance = 100_000
     participants = [BOB, bytes([3]) * 32, bytes([4]) * 32]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=2, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=2, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_exact_balance_for_fee",
         state,
         tx,
@@ -105,9 +149,9 @@ def test_multisig_fee_zero(state_test_group) -> None:
     """multisig with fee=0 should fail min-fee validation."""
     state = _base_state()
     participants = [BOB, bytes([3]) * 32, bytes([4]) * 32]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=2, participants=participants, fee=0)
+    tx = _mk_multisig(threshold=2, participants=participants, fee=0)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_fee_zero",
         state,
         tx,
@@ -116,17 +160,20 @@ def test_multisig_fee_zero(state_test_group) -> None:
 
 def test_multisig_threshold_zero(state_test_group) -> None:
     state = _base_state()
-    tx = _mk_multisig(ALICE, nonce=5, threshold=0, participants=[], fee=100_000)
+    tx = _mk_multisig(threshold=0, participants=[])
     state_test_group(
-        "transactions/account/multisig.json", "multisig_threshold_zero", state, tx
+        MULTISIG_PATH,
+        "multisig_threshold_zero",
+        state,
+        tx,
     )
 
 
 def test_multisig_single_participant(state_test_group) -> None:
     state = _base_state()
-    tx = _mk_multisig(ALICE, nonce=5, threshold=1, participants=[BOB], fee=100_000)
+    tx = _mk_multisig(threshold=1, participants=[BOB])
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_single_participant",
         state,
         tx,
@@ -136,9 +183,9 @@ def test_multisig_single_participant(state_test_group) -> None:
 def test_multisig_nonce_too_low(state_test_group) -> None:
     """Multisig with nonce below sender.nonce must fail."""
     state = _base_state()
-    tx = _mk_multisig(ALICE, nonce=4, threshold=1, participants=[BOB], fee=100_000)
+    tx = _mk_multisig(threshold=1, participants=[BOB], nonce=4)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_nonce_too_low",
         state,
         tx,
@@ -148,9 +195,9 @@ def test_multisig_nonce_too_low(state_test_group) -> None:
 def test_multisig_nonce_too_high_strict(state_test_group) -> None:
     """Multisig with nonce above sender.nonce must fail (strict nonce)."""
     state = _base_state()
-    tx = _mk_multisig(ALICE, nonce=6, threshold=1, participants=[BOB], fee=100_000)
+    tx = _mk_multisig(threshold=1, participants=[BOB], nonce=6)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_nonce_too_high_strict",
         state,
         tx,
@@ -162,14 +209,9 @@ def test_multisig_nonce_too_high_strict(state_test_group) -> None:
 
 def test_agent_account_register(state_test_group) -> None:
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register",
         state,
         tx,
@@ -180,14 +222,9 @@ def test_agent_account_register_insufficient_fee(state_test_group) -> None:
     """agent_account.register with balance below fee must fail: INSUFFICIENT_FEE (pre-check)."""
     state = _base_state()
     state.accounts[ALICE].balance = 99_999
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_insufficient_fee",
         state,
         tx,
@@ -198,14 +235,9 @@ def test_agent_account_register_exact_balance_for_fee(state_test_group) -> None:
     """Sender balance equals fee (boundary: exact fee coverage)."""
     state = _base_state()
     state.accounts[ALICE].balance = 100_000
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_exact_balance_for_fee",
         state,
         tx,
@@ -215,14 +247,9 @@ def test_agent_account_register_exact_balance_for_fee(state_test_group) -> None:
 def test_agent_account_register_fee_zero(state_test_group) -> None:
     """agent_account.register with fee=0 should fail min-fee validation."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=0)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD, fee=0)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_fee_zero",
         state,
         tx,
@@ -232,14 +259,9 @@ def test_agent_account_register_fee_zero(state_test_group) -> None:
 def test_agent_account_register_nonce_too_low(state_test_group) -> None:
     """Agent account register with nonce below sender.nonce must fail."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=4, payload=payload, fee=100_000)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD, nonce=4)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_nonce_too_low",
         state,
         tx,
@@ -249,14 +271,9 @@ def test_agent_account_register_nonce_too_low(state_test_group) -> None:
 def test_agent_account_register_nonce_too_high_strict(state_test_group) -> None:
     """Agent account register with nonce above sender.nonce must fail (strict nonce)."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=6, payload=payload, fee=100_000)
+    tx = _mk_agent_account(_REGISTER_PAYLOAD, nonce=6)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_nonce_too_high_strict",
         state,
         tx,
@@ -267,11 +284,11 @@ def test_agent_account_update_policy(state_test_group) -> None:
     state = _base_state()
     payload = {
         "variant": "update_policy",
-        "policy_hash": _hash(4),
+        "policy_hash": _NEW_POLICY_HASH,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_update_policy",
         state,
         tx,
@@ -284,9 +301,9 @@ def test_agent_account_rotate_controller(state_test_group) -> None:
         "variant": "rotate_controller",
         "new_controller": bytes([5]) * 32,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller",
         state,
         tx,
@@ -300,9 +317,9 @@ def test_multisig_duplicate_participants(state_test_group) -> None:
     """Duplicate keys in participant list."""
     state = _base_state()
     participants = [BOB, BOB, CAROL]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=2, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=2, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_duplicate_participants",
         state,
         tx,
@@ -315,14 +332,10 @@ def test_multisig_duplicate_participants(state_test_group) -> None:
 def test_agent_account_register_zero_controller(state_test_group) -> None:
     """Register agent account with zero controller should fail."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": bytes(32),  # zero controller
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    payload = {**_REGISTER_PAYLOAD, "controller": bytes(32)}  # zero controller
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_zero_controller",
         state,
         tx,
@@ -332,14 +345,10 @@ def test_agent_account_register_zero_controller(state_test_group) -> None:
 def test_agent_account_register_self_controller(state_test_group) -> None:
     """Register agent account with controller == owner should fail."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": ALICE,  # same as source
-        "policy_hash": _hash(3),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    payload = {**_REGISTER_PAYLOAD, "controller": ALICE}  # same as source
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_self_controller",
         state,
         tx,
@@ -349,14 +358,10 @@ def test_agent_account_register_self_controller(state_test_group) -> None:
 def test_agent_account_register_zero_policy_hash(state_test_group) -> None:
     """Register agent account with zero policy_hash should fail."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": bytes(32),  # zero hash
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    payload = {**_REGISTER_PAYLOAD, "policy_hash": bytes(32)}  # zero hash
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_zero_policy_hash",
         state,
         tx,
@@ -365,21 +370,15 @@ def test_agent_account_register_zero_policy_hash(state_test_group) -> None:
 
 def test_agent_account_register_already_registered(state_test_group) -> None:
     """Register agent account when already registered should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
-        "variant": "register",
+        **_REGISTER_PAYLOAD,
         "controller": CAROL,
-        "policy_hash": _hash(4),
+        "policy_hash": _NEW_POLICY_HASH,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_already_registered",
         state,
         tx,
@@ -392,11 +391,11 @@ def test_agent_account_update_policy_not_registered(state_test_group) -> None:
     # No agent_accounts entry for ALICE
     payload = {
         "variant": "update_policy",
-        "policy_hash": _hash(4),
+        "policy_hash": _NEW_POLICY_HASH,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_update_policy_not_registered",
         state,
         tx,
@@ -405,20 +404,14 @@ def test_agent_account_update_policy_not_registered(state_test_group) -> None:
 
 def test_agent_account_update_policy_zero_hash(state_test_group) -> None:
     """Update policy with zero hash should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "update_policy",
         "policy_hash": bytes(32),  # zero hash
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_update_policy_zero_hash",
         state,
         tx,
@@ -433,9 +426,9 @@ def test_agent_account_rotate_controller_not_registered(state_test_group) -> Non
         "variant": "rotate_controller",
         "new_controller": bytes([5]) * 32,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller_not_registered",
         state,
         tx,
@@ -444,20 +437,14 @@ def test_agent_account_rotate_controller_not_registered(state_test_group) -> Non
 
 def test_agent_account_rotate_controller_to_self(state_test_group) -> None:
     """Rotate controller to owner (self) should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "rotate_controller",
         "new_controller": ALICE,  # same as owner
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller_to_self",
         state,
         tx,
@@ -466,20 +453,14 @@ def test_agent_account_rotate_controller_to_self(state_test_group) -> None:
 
 def test_agent_account_rotate_controller_zero(state_test_group) -> None:
     """Rotate controller to zero key should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "rotate_controller",
         "new_controller": bytes(32),  # zero key
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller_zero",
         state,
         tx,
@@ -494,9 +475,9 @@ def test_agent_account_set_status_not_registered(state_test_group) -> None:
         "variant": "set_status",
         "status": 1,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_status_not_registered",
         state,
         tx,
@@ -505,20 +486,14 @@ def test_agent_account_set_status_not_registered(state_test_group) -> None:
 
 def test_agent_account_set_status_invalid(state_test_group) -> None:
     """Set status to invalid value should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "set_status",
         "status": 99,  # invalid
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_status_invalid",
         state,
         tx,
@@ -531,9 +506,9 @@ def test_agent_account_unknown_variant(state_test_group) -> None:
     payload = {
         "variant": "nonexistent_variant",
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_unknown_variant",
         state,
         tx,
@@ -547,9 +522,9 @@ def test_multisig_threshold_exceeds_participants(state_test_group) -> None:
     """Multisig with threshold > len(participants) must fail."""
     state = _base_state()
     participants = [BOB, CAROL]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=5, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=5, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_threshold_exceeds_participants",
         state,
         tx,
@@ -561,9 +536,9 @@ def test_multisig_max_participants(state_test_group) -> None:
     state = _base_state()
     # Generate 255 distinct participant keys
     participants = [bytes([i]) + bytes(31) for i in range(MAX_MULTISIG_PARTICIPANTS)]
-    tx = _mk_multisig(ALICE, nonce=5, threshold=1, participants=participants, fee=100_000)
+    tx = _mk_multisig(threshold=1, participants=participants)
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_max_participants",
         state,
         tx,
@@ -573,9 +548,9 @@ def test_multisig_max_participants(state_test_group) -> None:
 def test_multisig_zero_participants_nonzero_threshold(state_test_group) -> None:
     """Multisig with threshold=1 but empty participants list must fail."""
     state = _base_state()
-    tx = _mk_multisig(ALICE, nonce=5, threshold=1, participants=[], fee=100_000)
+    tx = _mk_multisig(threshold=1, participants=[])
     state_test_group(
-        "transactions/account/multisig.json",
+        MULTISIG_PATH,
         "multisig_zero_participants_nonzero_threshold",
         state,
         tx,
@@ -587,20 +562,14 @@ def test_multisig_zero_participants_nonzero_threshold(state_test_group) -> None:
 
 def test_agent_account_rotate_controller_same_as_current(state_test_group) -> None:
     """Rotate controller to the same current controller should fail."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "rotate_controller",
         "new_controller": BOB,  # same as current controller
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller_same_as_current",
         state,
         tx,
@@ -610,67 +579,33 @@ def test_agent_account_rotate_controller_same_as_current(state_test_group) -> No
 # --- agent_account: set_status success ---
 
 
-def test_agent_account_set_status_zero(state_test_group) -> None:
-    """Set status to 0 (active) should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=1,
-    )
-    payload = {
-        "variant": "set_status",
-        "status": 0,
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
-    state_test_group(
-        "transactions/account/agent_account.json",
-        "agent_account_set_status_zero",
-        state,
-        tx,
-    )
+# (id, status before, requested status). 0 (active) and 1 (disabled) are the
+# only valid values.
+_SET_STATUS_CASES = [
+    ("zero", 1, 0),
+    ("one", 0, 1),
+    ("two", 0, 2),
+]
 
 
-def test_agent_account_set_status_one(state_test_group) -> None:
-    """Set status to 1 (disabled) should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
-    payload = {
-        "variant": "set_status",
-        "status": 1,
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
-    state_test_group(
-        "transactions/account/agent_account.json",
-        "agent_account_set_status_one",
-        state,
-        tx,
-    )
-
-
-def test_agent_account_set_status_two(state_test_group) -> None:
-    """Set status to 2 should fail (valid values are 0 and 1 only)."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+@pytest.mark.parametrize(
+    ("case", "current", "status"),
+    _SET_STATUS_CASES,
+    ids=[c[0] for c in _SET_STATUS_CASES],
+)
+def test_agent_account_set_status(
+    state_test_group, case: str, current: int, status: int
+) -> None:
+    """Set status on a registered account; only 0 and 1 are accepted."""
+    state = _registered_state(status=current)
     payload = {
         "variant": "set_status",
-        "status": 2,
+        "status": status,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
-        "agent_account_set_status_two",
+        AGENT_ACCOUNT_PATH,
+        f"agent_account_set_status_{case}",
         state,
         tx,
     )
@@ -681,20 +616,14 @@ def test_agent_account_set_status_two(state_test_group) -> None:
 
 def test_agent_account_set_energy_pool_success(state_test_group) -> None:
     """Set energy pool to owner address should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "set_energy_pool",
         "energy_pool": ALICE,  # owner
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_energy_pool_success",
         state,
         tx,
@@ -703,21 +632,14 @@ def test_agent_account_set_energy_pool_success(state_test_group) -> None:
 
 def test_agent_account_set_energy_pool_clear(state_test_group) -> None:
     """Clear energy pool (set to None) should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-        energy_pool=ALICE,
-    )
+    state = _registered_state(energy_pool=ALICE)
     payload = {
         "variant": "set_energy_pool",
         "energy_pool": None,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_energy_pool_clear",
         state,
         tx,
@@ -732,9 +654,9 @@ def test_agent_account_set_energy_pool_not_registered(state_test_group) -> None:
         "variant": "set_energy_pool",
         "energy_pool": ALICE,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_energy_pool_not_registered",
         state,
         tx,
@@ -746,20 +668,14 @@ def test_agent_account_set_energy_pool_not_registered(state_test_group) -> None:
 
 def test_agent_account_set_session_key_root_success(state_test_group) -> None:
     """Set session key root to a non-zero hash should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "set_session_key_root",
-        "session_key_root": _hash(9),
+        "session_key_root": _SESSION_KEY_ROOT,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_session_key_root_success",
         state,
         tx,
@@ -768,21 +684,14 @@ def test_agent_account_set_session_key_root_success(state_test_group) -> None:
 
 def test_agent_account_set_session_key_root_clear(state_test_group) -> None:
     """Clear session key root (set to None) should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-        session_key_root=_hash(9),
-    )
+    state = _registered_state(session_key_root=_SESSION_KEY_ROOT)
     payload = {
         "variant": "set_session_key_root",
         "session_key_root": None,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_session_key_root_clear",
         state,
         tx,
@@ -795,11 +704,11 @@ def test_agent_account_set_session_key_root_not_registered(state_test_group) ->
     # No agent_accounts entry for ALICE
     payload = {
         "variant": "set_session_key_root",
-        "session_key_root": _hash(9),
+        "session_key_root": _SESSION_KEY_ROOT,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_set_session_key_root_not_registered",
         state,
         tx,
@@ -812,15 +721,10 @@ def test_agent_account_set_session_key_root_not_registered(state_test_group) ->
 def test_agent_account_register_with_energy_pool(state_test_group) -> None:
     """Register agent account with energy_pool set to owner."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-        "energy_pool": ALICE,
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    payload = {**_REGISTER_PAYLOAD, "energy_pool": ALICE}
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_with_energy_pool",
         state,
         tx,
@@ -830,15 +734,10 @@ def test_agent_account_register_with_energy_pool(state_test_group) -> None:
 def test_agent_account_register_with_session_key_root(state_test_group) -> None:
     """Register agent account with session_key_root set."""
     state = _base_state()
-    payload = {
-        "variant": "register",
-        "controller": BOB,
-        "policy_hash": _hash(3),
-        "session_key_root": _hash(9),
-    }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    payload = {**_REGISTER_PAYLOAD, "session_key_root": _SESSION_KEY_ROOT}
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_register_with_session_key_root",
         state,
         tx,
@@ -850,20 +749,14 @@ def test_agent_account_register_with_session_key_root(state_test_group) -> None:
 
 def test_agent_account_update_policy_success(state_test_group) -> None:
     """Update policy with non-zero hash when registered should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "update_policy",
-        "policy_hash": _hash(4),
+        "policy_hash": _NEW_POLICY_HASH,
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_update_policy_success",
         state,
         tx,
@@ -875,20 +768,14 @@ def test_agent_account_update_policy_success(state_test_group) -> None:
 
 def test_agent_account_rotate_controller_success(state_test_group) -> None:
     """Rotate controller to a new valid controller should succeed."""
-    state = _base_state()
-    state.agent_accounts[ALICE] = AgentAccountMeta(
-        owner=ALICE,
-        controller=BOB,
-        policy_hash=_hash(3),
-        status=0,
-    )
+    state = _registered_state()
     payload = {
         "variant": "rotate_controller",
         "new_controller": DAVE,  # new controller
     }
-    tx = _mk_agent_account(ALICE, nonce=5, payload=payload, fee=100_000)
+    tx = _mk_agent_account(payload)
     state_test_group(
-        "transactions/account/agent_account.json",
+        AGENT_ACCOUNT_PATH,
         "agent_account_rotate_controller_success",
         state,
         tx,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from tos_spec.config import CHAIN_ID_DEVNET
 from tos_spec.test_accounts import ALICE
 from tos_spec.types import (
@@ -12,15 +14,19 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+
 U64_MAX = (1 << 64) - 1
 
 
+@state_factory
 def _base_state() -> ChainState:
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     state.accounts[ALICE] = AccountState(address=ALICE, balance=1_000_000, nonce=5)
@@ -33,96 +39,48 @@ def _mk_burn(sender: bytes, nonce: int, amount: int, fee: int) -> Transaction:
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.BURN,
-        payload={"asset": _hash(0), "amount": amount},
+        payload={"asset": _ZERO_HASH, "amount": amount},
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
-def test_burn_success(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=100_000, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_success", state, tx)
-
-
-def test_burn_fee_zero(state_test_group) -> None:
-    """burn with fee=0 should fail min-fee validation."""
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=100_000, fee=0)
-    state_test_group("transactions/core/burn.json", "burn_fee_zero", state, tx)
-
-
-def test_burn_nonce_too_low(state_test_group) -> None:
-    """Strict nonce: tx.nonce < sender.nonce."""
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=4, amount=100_000, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_nonce_too_low", state, tx)
-
-
-def test_burn_nonce_too_high_strict(state_test_group) -> None:
-    """Strict nonce: tx.nonce > sender.nonce."""
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=6, amount=100_000, fee=100_000)
-    state_test_group(
-        "transactions/core/burn.json", "burn_nonce_too_high_strict", state, tx
-    )
-
-
-def test_burn_insufficient_balance(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=2_000_000, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_insufficient_balance", state, tx)
-
-
-def test_burn_exact_balance(state_test_group) -> None:
-    """Boundary: sender balance exactly equals burn amount + fee (should succeed)."""
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    fee = 100_000
-    amount = 100_000
-    state.accounts[ALICE] = AccountState(address=ALICE, balance=amount + fee, nonce=5)
-    tx = _mk_burn(ALICE, nonce=5, amount=amount, fee=fee)
-    state_test_group("transactions/core/burn.json", "burn_exact_balance", state, tx)
-
-
-def test_burn_insufficient_balance_after_fee(state_test_group) -> None:
-    """Boundary: can pay fee and amount individually, but not amount + fee."""
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    fee = 100_000
-    amount = 100_000
-    state.accounts[ALICE] = AccountState(address=ALICE, balance=amount + fee - 1, nonce=5)
-    tx = _mk_burn(ALICE, nonce=5, amount=amount, fee=fee)
-    state_test_group("transactions/core/burn.json", "burn_insufficient_balance_after_fee", state, tx)
-
-
-def test_burn_invalid_amount(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=0, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_invalid_amount", state, tx)
-
-
-def test_burn_negative_amount(state_test_group) -> None:
-    """Burn with negative amount."""
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=-1, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_negative_amount", state, tx)
-
-
-def test_burn_amount_overflow(state_test_group) -> None:
-    """Burn amount exceeds u64 max."""
-    state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=U64_MAX + 1, fee=100_000)
-    state_test_group("transactions/core/burn.json", "burn_amount_overflow", state, tx)
-
-
-def test_burn_amount_plus_fee_overflow(state_test_group) -> None:
-    """Burn amount + fee overflows u64."""
+# (case name, nonce, amount, fee, sender balance or None for the base 1_000_000).
+# ALICE's nonce is 5; every case burns from the base state.
+_BURN_CASES = [
+    ("burn_success", 5, 100_000, 100_000, None),
+    ("burn_fee_zero", 5, 100_000, 0, None),  # fails min-fee validation
+    ("burn_nonce_too_low", 4, 100_000, 100_000, None),
+    ("burn_nonce_too_high_strict", 6, 100_000, 100_000, None),
+    ("burn_insufficient_balance", 5, 2_000_000, 100_000, None),
+    # Boundary: balance exactly covers amount + fee (succeeds) ...
+    ("burn_exact_balance", 5, 100_000, 100_000, 200_000),
+    # ... or covers amount and fee individually but not their sum.
+    ("burn_insufficient_balance_after_fee", 5, 100_000, 100_000, 199_999),
+    ("burn_invalid_amount", 5, 0, 100_000, None),
+    ("burn_negative_amount", 5, -1, 100_000, None),
+    ("burn_amount_overflow", 5, U64_MAX + 1, 100_000, None),
+    ("burn_amount_plus_fee_overflow", 5, U64_MAX, 1, None),
+]
+
+
+@pytest.mark.parametrize(
+    ("case", "nonce", "amount", "fee", "balance"),
+    _BURN_CASES,
+    ids=[c[0] for c in _BURN_CASES],
+)
+def test_burn(
+    state_test_group, case: str, nonce: int, amount: int, fee: int, balance: int | None
+) -> None:
     state = _base_state()
-    tx = _mk_burn(ALICE, nonce=5, amount=U64_MAX, fee=1)
-    state_test_group("transactions/core/burn.json", "burn_amount_plus_fee_overflow", state, tx)
+    if balance is not None:
+        state.accounts[ALICE].balance = balance
+    tx = _mk_burn(ALICE, nonce=nonce, amount=amount, fee=fee)
+    state_test_group("transactions/core/burn.json", case, state, tx)
 
 
 def test_burn_total_burned_overflow(state_test_group) -> None:
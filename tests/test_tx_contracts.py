@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from blake3 import blake3
 
 from tos_spec.config import (
@@ -21,12 +23,22 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+_MISSING_CONTRACT = _hash(99)  # never deployed in any base state
+
+# Balance boundaries, computed once at import.
+_RICH_BALANCE = 10_000 * COIN_VALUE
+_DEPLOY_FEE = 100_000
+_DEPLOY_COST = BURN_PER_CONTRACT + _DEPLOY_FEE
+
+
 # Minimal valid ELF module (ELF magic + padding)
 _HELLO_ELF = b"\x7FELF" + b"\x00" * 100
 
@@ -41,6 +53,7 @@ def _compute_contract_address(deployer: bytes, bytecode: bytes) -> bytes:
     return blake3(data).digest()
 
 
+@state_factory
 def _base_state() -> ChainState:
     sender = ALICE
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
@@ -50,8 +63,7 @@ def _base_state() -> ChainState:
     return state
 
 
-def _base_state_with_contract() -> tuple[ChainState, bytes]:
-    """Create base state with a pre-deployed contract. Returns (state, contract_hash)."""
+def _build_state_with_contract() -> tuple[ChainState, bytes]:
     state = _base_state()
     contract_hash = _compute_contract_address(ALICE, _HELLO_ELF)
     state.contracts[contract_hash] = ContractState(
@@ -60,8 +72,25 @@ def _base_state_with_contract() -> tuple[ChainState, bytes]:
     return state, contract_hash
 
 
+# Built once at import, which also saves two blake3 digests per test.
+_STATE_WITH_CONTRACT, _CONTRACT_HASH = _build_state_with_contract()
+
+
+def _base_state_with_contract(
+    balance: int | None = None,
+) -> tuple[ChainState, bytes]:
+    """Create base state with a pre-deployed contract. Returns (state, contract_hash).
+
+    ``balance`` overrides ALICE's starting balance.
+    """
+    state = _STATE_WITH_CONTRACT.clone()
+    if balance is not None:
+        state.accounts[ALICE].balance = balance
+    return state, _CONTRACT_HASH
+
+
 def _mk_deploy_contract(
-    sender: bytes, nonce: int, module: bytes, fee: int
+    module: bytes, *, sender: bytes = ALICE, nonce: int = 5, fee: int = 100_000
 ) -> Transaction:
     return Transaction(
         version=TxVersion.T1,
@@ -72,45 +101,63 @@ def _mk_deploy_contract(
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
-def _mk_invoke_contract(
-    sender: bytes, nonce: int, contract: bytes, entry_id: int, max_gas: int, fee: int
+def _invoke_payload(contract: bytes, **overrides: Any) -> dict[str, Any]:
+    """invoke_contract payload with the common defaults; overrides replace fields."""
+    return {
+        "contract": contract,
+        "deposits": [],
+        "entry_id": 0,
+        "max_gas": 100_000,
+        "parameters": [],
+        **overrides,
+    }
+
+
+def _mk_invoke_tx(
+    payload: dict[str, Any], *, sender: bytes = ALICE, nonce: int = 5, fee: int = 100_000
 ) -> Transaction:
     return Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract,
-            "deposits": [],
-            "entry_id": entry_id,
-            "max_gas": max_gas,
-            "parameters": [],
-        },
+        payload=payload,
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
+def _mk_invoke_contract(
+    contract: bytes,
+    *,
+    entry_id: int = 0,
+    max_gas: int = 100_000,
+    sender: bytes = ALICE,
+    nonce: int = 5,
+    fee: int = 100_000,
+) -> Transaction:
+    payload = _invoke_payload(contract, entry_id=entry_id, max_gas=max_gas)
+    return _mk_invoke_tx(payload, sender=sender, nonce=nonce, fee=fee)
+
+
 # --- deploy_contract specs ---
 
 
 def test_deploy_contract_success(state_test_group) -> None:
     state = _base_state()
-    sender = ALICE
     # Minimal valid ELF module
     module = _HELLO_ELF
-    tx = _mk_deploy_contract(sender, nonce=5, module=module, fee=100_000)
+    tx = _mk_deploy_contract(module)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_success",
@@ -122,7 +169,7 @@ def test_deploy_contract_success(state_test_group) -> None:
 def test_deploy_contract_fee_zero(state_test_group) -> None:
     """deploy_contract with fee=0 should fail min-fee validation."""
     state = _base_state()
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=_HELLO_ELF, fee=0)
+    tx = _mk_deploy_contract(_HELLO_ELF, fee=0)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_fee_zero",
@@ -133,9 +180,8 @@ def test_deploy_contract_fee_zero(state_test_group) -> None:
 
 def test_deploy_contract_invalid_module(state_test_group) -> None:
     state = _base_state()
-    sender = ALICE
     module = b"\x00" * 100  # Not an ELF
-    tx = _mk_deploy_contract(sender, nonce=5, module=module, fee=100_000)
+    tx = _mk_deploy_contract(module)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_invalid_module",
@@ -149,10 +195,7 @@ def test_deploy_contract_invalid_module(state_test_group) -> None:
 
 def test_invoke_contract_success(state_test_group) -> None:
     state, contract_hash = _base_state_with_contract()
-    sender = ALICE
-    tx = _mk_invoke_contract(
-        sender, nonce=5, contract=contract_hash, entry_id=0, max_gas=100_000, fee=100_000
-    )
+    tx = _mk_invoke_contract(contract_hash)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_success",
@@ -164,9 +207,7 @@ def test_invoke_contract_success(state_test_group) -> None:
 def test_invoke_contract_fee_zero(state_test_group) -> None:
     """invoke_contract with fee=0 should fail min-fee validation."""
     state, contract_hash = _base_state_with_contract()
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0, max_gas=100_000, fee=0
-    )
+    tx = _mk_invoke_contract(contract_hash, fee=0)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_fee_zero",
@@ -177,26 +218,13 @@ def test_invoke_contract_fee_zero(state_test_group) -> None:
 
 def test_invoke_contract_with_deposits(state_test_group) -> None:
     state, contract_hash = _base_state_with_contract()
-    sender = ALICE
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=sender,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": [{"asset": _hash(0), "amount": COIN_VALUE}],
-            "entry_id": 1,
-            "max_gas": 200_000,
-            "parameters": [],
-        },
-        fee=100_000,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
+    payload = _invoke_payload(
+        contract_hash,
+        deposits=[{"asset": _ZERO_HASH, "amount": COIN_VALUE}],
+        entry_id=1,
+        max_gas=200_000,
     )
+    tx = _mk_invoke_tx(payload)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_with_deposits",
@@ -208,10 +236,7 @@ def test_invoke_contract_with_deposits(state_test_group) -> None:
 def test_invoke_contract_zero_gas(state_test_group) -> None:
     """Invoke with max_gas=0."""
     state, contract_hash = _base_state_with_contract()
-    sender = ALICE
-    tx = _mk_invoke_contract(
-        sender, nonce=5, contract=contract_hash, entry_id=0, max_gas=0, fee=100_000
-    )
+    tx = _mk_invoke_contract(contract_hash, max_gas=0)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_zero_gas",
@@ -223,9 +248,7 @@ def test_invoke_contract_zero_gas(state_test_group) -> None:
 def test_invoke_contract_nonce_too_low(state_test_group) -> None:
     """Strict nonce: tx.nonce < sender.nonce."""
     state, contract_hash = _base_state_with_contract()
-    tx = _mk_invoke_contract(
-        ALICE, nonce=4, contract=contract_hash, entry_id=0, max_gas=100_000, fee=100_000
-    )
+    tx = _mk_invoke_contract(contract_hash, nonce=4)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_nonce_too_low",
@@ -237,9 +260,7 @@ def test_invoke_contract_nonce_too_low(state_test_group) -> None:
 def test_invoke_contract_nonce_too_high_strict(state_test_group) -> None:
     """Strict nonce: tx.nonce > sender.nonce."""
     state, contract_hash = _base_state_with_contract()
-    tx = _mk_invoke_contract(
-        ALICE, nonce=6, contract=contract_hash, entry_id=0, max_gas=100_000, fee=100_000
-    )
+    tx = _mk_invoke_contract(contract_hash, nonce=6)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_nonce_too_high_strict",
@@ -251,8 +272,7 @@ def test_invoke_contract_nonce_too_high_strict(state_test_group) -> None:
 def test_deploy_contract_empty_code(state_test_group) -> None:
     """Deploy with empty bytecode."""
     state = _base_state()
-    sender = ALICE
-    tx = _mk_deploy_contract(sender, nonce=5, module=b"", fee=100_000)
+    tx = _mk_deploy_contract(b"")
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_empty_code",
@@ -272,10 +292,7 @@ def test_deploy_contract_empty_code(state_test_group) -> None:
 def test_invoke_contract_not_found(state_test_group) -> None:
     """Invoke a contract that does not exist."""
     state = _base_state()
-    fake_contract = _hash(99)
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=fake_contract, entry_id=0, max_gas=100_000, fee=100_000
-    )
+    tx = _mk_invoke_contract(_MISSING_CONTRACT)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_not_found",
@@ -286,12 +303,9 @@ def test_invoke_contract_not_found(state_test_group) -> None:
 
 def test_invoke_contract_insufficient_balance_for_gas(state_test_group) -> None:
     """Sender cannot afford max_gas + fee."""
-    state, contract_hash = _base_state_with_contract()
-    # Set balance to barely cover fee but not gas
-    state.accounts[ALICE].balance = 200_000
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0, max_gas=500_000, fee=100_000
-    )
+    # Balance barely covers the fee but not the gas
+    state, contract_hash = _base_state_with_contract(balance=200_000)
+    tx = _mk_invoke_contract(contract_hash, max_gas=500_000)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_insufficient_balance_for_gas",
@@ -302,13 +316,10 @@ def test_invoke_contract_insufficient_balance_for_gas(state_test_group) -> None:
 
 def test_invoke_contract_exact_balance(state_test_group) -> None:
     """Sender has exactly max_gas + fee."""
-    state, contract_hash = _base_state_with_contract()
     max_gas = 500_000
     fee = 100_000
-    state.accounts[ALICE].balance = max_gas + fee
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0, max_gas=max_gas, fee=fee
-    )
+    state, contract_hash = _base_state_with_contract(balance=max_gas + fee)
+    tx = _mk_invoke_contract(contract_hash, max_gas=max_gas, fee=fee)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_exact_balance",
@@ -319,13 +330,10 @@ def test_invoke_contract_exact_balance(state_test_group) -> None:
 
 def test_invoke_contract_insufficient_balance_after_fee(state_test_group) -> None:
     """Sender covers max_gas but not (max_gas + fee)."""
-    state, contract_hash = _base_state_with_contract()
     max_gas = 500_000
     fee = 100_000
-    state.accounts[ALICE].balance = max_gas + fee - 1
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0, max_gas=max_gas, fee=fee
-    )
+    state, contract_hash = _base_state_with_contract(balance=max_gas + fee - 1)
+    tx = _mk_invoke_contract(contract_hash, max_gas=max_gas, fee=fee)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_insufficient_balance_after_fee",
@@ -336,28 +344,10 @@ def test_invoke_contract_insufficient_balance_after_fee(state_test_group) -> Non
 
 def test_invoke_contract_too_many_deposits(state_test_group) -> None:
     """Exceed MAX_DEPOSIT_PER_INVOKE_CALL."""
-    state, contract_hash = _base_state_with_contract()
-    state.accounts[ALICE].balance = 10_000 * COIN_VALUE
+    state, contract_hash = _base_state_with_contract(balance=_RICH_BALANCE)
     deposits = [{"asset": _hash(i % 256), "amount": 1} for i in range(MAX_DEPOSIT_PER_INVOKE_CALL + 1)]
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": deposits,
-            "entry_id": 0,
-            "max_gas": 100_000,
-            "parameters": [],
-        },
-        fee=COIN_VALUE,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    payload = _invoke_payload(contract_hash, deposits=deposits)
+    tx = _mk_invoke_tx(payload, fee=COIN_VALUE)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_too_many_deposits",
@@ -369,25 +359,8 @@ def test_invoke_contract_too_many_deposits(state_test_group) -> None:
 def test_invoke_contract_zero_deposit_amount(state_test_group) -> None:
     """Deposit amount in invoke must be > 0."""
     state, contract_hash = _base_state_with_contract()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": [{"asset": _hash(0), "amount": 0}],
-            "entry_id": 0,
-            "max_gas": 100_000,
-            "parameters": [],
-        },
-        fee=100_000,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    payload = _invoke_payload(contract_hash, deposits=[{"asset": _ZERO_HASH, "amount": 0}])
+    tx = _mk_invoke_tx(payload)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_zero_deposit_amount",
@@ -402,7 +375,7 @@ def test_invoke_contract_zero_deposit_amount(state_test_group) -> None:
 def test_deploy_contract_short_module(state_test_group) -> None:
     """Module too short to contain ELF magic."""
     state = _base_state()
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=b"\x7fEL", fee=100_000)
+    tx = _mk_deploy_contract(b"\x7fEL")
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_short_module",
@@ -418,28 +391,10 @@ def test_deploy_contract_short_module(state_test_group) -> None:
 
 def test_invoke_contract_max_deposits(state_test_group) -> None:
     """Invoke with exactly MAX_DEPOSIT_PER_INVOKE_CALL deposits (boundary: should pass)."""
-    state, contract_hash = _base_state_with_contract()
-    state.accounts[ALICE].balance = 10_000 * COIN_VALUE
+    state, contract_hash = _base_state_with_contract(balance=_RICH_BALANCE)
     deposits = [{"asset": _hash(i % 256), "amount": 1} for i in range(MAX_DEPOSIT_PER_INVOKE_CALL)]
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": deposits,
-            "entry_id": 0,
-            "max_gas": 100_000,
-            "parameters": [],
-        },
-        fee=COIN_VALUE,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    payload = _invoke_payload(contract_hash, deposits=deposits)
+    tx = _mk_invoke_tx(payload, fee=COIN_VALUE)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_max_deposits",
@@ -451,7 +406,7 @@ def test_invoke_contract_max_deposits(state_test_group) -> None:
 def test_deploy_contract_empty_module(state_test_group) -> None:
     """Deploy with empty module bytes should fail."""
     state = _base_state()
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=b"", fee=100_000)
+    tx = _mk_deploy_contract(b"")
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_empty_module",
@@ -463,25 +418,8 @@ def test_deploy_contract_empty_module(state_test_group) -> None:
 def test_invoke_contract_negative_gas(state_test_group) -> None:
     """Invoke with max_gas < 0 should be rejected."""
     state, contract_hash = _base_state_with_contract()
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": [],
-            "entry_id": 0,
-            "max_gas": -1,
-            "parameters": [],
-        },
-        fee=100_000,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    payload = _invoke_payload(contract_hash, max_gas=-1)
+    tx = _mk_invoke_tx(payload)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_negative_gas",
@@ -497,12 +435,8 @@ def test_invoke_contract_negative_gas(state_test_group) -> None:
 
 def test_invoke_contract_max_gas_exceeded(state_test_group) -> None:
     """Invoke with max_gas exceeding MAX_GAS_USAGE_PER_TX must fail."""
-    state, contract_hash = _base_state_with_contract()
-    state.accounts[ALICE].balance = 10_000 * COIN_VALUE
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0,
-        max_gas=MAX_GAS_USAGE_PER_TX + 1, fee=100_000,
-    )
+    state, contract_hash = _base_state_with_contract(balance=_RICH_BALANCE)
+    tx = _mk_invoke_contract(contract_hash, max_gas=MAX_GAS_USAGE_PER_TX + 1)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_max_gas_exceeded",
@@ -513,12 +447,8 @@ def test_invoke_contract_max_gas_exceeded(state_test_group) -> None:
 
 def test_invoke_contract_max_gas_exact_limit(state_test_group) -> None:
     """Invoke with max_gas exactly at MAX_GAS_USAGE_PER_TX should succeed."""
-    state, contract_hash = _base_state_with_contract()
-    state.accounts[ALICE].balance = 10_000 * COIN_VALUE
-    tx = _mk_invoke_contract(
-        ALICE, nonce=5, contract=contract_hash, entry_id=0,
-        max_gas=MAX_GAS_USAGE_PER_TX, fee=100_000,
-    )
+    state, contract_hash = _base_state_with_contract(balance=_RICH_BALANCE)
+    tx = _mk_invoke_contract(contract_hash, max_gas=MAX_GAS_USAGE_PER_TX)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_max_gas_exact_limit",
@@ -539,7 +469,7 @@ def test_deploy_contract_insufficient_balance(state_test_group) -> None:
     state.accounts[ALICE] = AccountState(
         address=ALICE, balance=BURN_PER_CONTRACT - 1, nonce=5
     )
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=_HELLO_ELF, fee=100_000)
+    tx = _mk_deploy_contract(_HELLO_ELF)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_insufficient_balance",
@@ -551,11 +481,10 @@ def test_deploy_contract_insufficient_balance(state_test_group) -> None:
 def test_deploy_contract_exact_balance(state_test_group) -> None:
     """Deploy when sender has exactly BURN_PER_CONTRACT + fee should succeed."""
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    fee = 100_000
     state.accounts[ALICE] = AccountState(
-        address=ALICE, balance=BURN_PER_CONTRACT + fee, nonce=5
+        address=ALICE, balance=_DEPLOY_COST, nonce=5
     )
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=_HELLO_ELF, fee=fee)
+    tx = _mk_deploy_contract(_HELLO_ELF, fee=_DEPLOY_FEE)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_exact_balance",
@@ -567,11 +496,10 @@ def test_deploy_contract_exact_balance(state_test_group) -> None:
 def test_deploy_contract_insufficient_balance_after_fee(state_test_group) -> None:
     """Deploy when sender has (BURN_PER_CONTRACT + fee - 1) should fail."""
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
-    fee = 100_000
     state.accounts[ALICE] = AccountState(
-        address=ALICE, balance=BURN_PER_CONTRACT + fee - 1, nonce=5
+        address=ALICE, balance=_DEPLOY_COST - 1, nonce=5
     )
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=_HELLO_ELF, fee=fee)
+    tx = _mk_deploy_contract(_HELLO_ELF, fee=_DEPLOY_FEE)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_insufficient_balance_after_fee",
@@ -584,7 +512,7 @@ def test_deploy_contract_wrong_magic(state_test_group) -> None:
     """Deploy with module that has wrong magic bytes (not ELF)."""
     state = _base_state()
     module = b"\x7fEXF" + b"\x00" * 100  # Wrong magic
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=module, fee=100_000)
+    tx = _mk_deploy_contract(module)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_wrong_magic",
@@ -597,7 +525,7 @@ def test_deploy_contract_exactly_4_bytes_elf(state_test_group) -> None:
     """Deploy with module that is exactly 4 bytes (minimal valid ELF header)."""
     state = _base_state()
     module = b"\x7fELF"
-    tx = _mk_deploy_contract(ALICE, nonce=5, module=module, fee=100_000)
+    tx = _mk_deploy_contract(module)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_exactly_4_bytes_elf",
@@ -609,7 +537,7 @@ def test_deploy_contract_exactly_4_bytes_elf(state_test_group) -> None:
 def test_deploy_contract_nonce_too_low(state_test_group) -> None:
     """Deploy with nonce below sender.nonce must fail."""
     state = _base_state()
-    tx = _mk_deploy_contract(ALICE, nonce=4, module=_HELLO_ELF, fee=100_000)
+    tx = _mk_deploy_contract(_HELLO_ELF, nonce=4)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_nonce_too_low",
@@ -621,7 +549,7 @@ def test_deploy_contract_nonce_too_low(state_test_group) -> None:
 def test_deploy_contract_nonce_too_high_strict(state_test_group) -> None:
     """Deploy with nonce above sender.nonce must fail (strict nonce)."""
     state = _base_state()
-    tx = _mk_deploy_contract(ALICE, nonce=6, module=_HELLO_ELF, fee=100_000)
+    tx = _mk_deploy_contract(_HELLO_ELF, nonce=6)
     state_test_group(
         "transactions/contracts/deploy_contract.json",
         "deploy_contract_nonce_too_high_strict",
@@ -632,31 +560,16 @@ def test_deploy_contract_nonce_too_high_strict(state_test_group) -> None:
 
 def test_invoke_contract_duplicate_deposit_assets(state_test_group) -> None:
     """Invoke with two deposits using the same asset hash (duplicates are canonicalized in encoding)."""
-    state, contract_hash = _base_state_with_contract()
-    state.accounts[ALICE].balance = 1000 * COIN_VALUE
-    same_asset = _hash(0)
-    tx = Transaction(
-        version=TxVersion.T1,
-        chain_id=CHAIN_ID_DEVNET,
-        source=ALICE,
-        tx_type=TransactionType.INVOKE_CONTRACT,
-        payload={
-            "contract": contract_hash,
-            "deposits": [
-                {"asset": same_asset, "amount": COIN_VALUE},
-                {"asset": same_asset, "amount": COIN_VALUE * 2},
-            ],
-            "entry_id": 0,
-            "max_gas": 100_000,
-            "parameters": [],
-        },
-        fee=100_000,
-        fee_type=FeeType.TOS,
-        nonce=5,
-        reference_hash=_hash(0),
-        reference_topoheight=0,
-        signature=bytes(64),
-    )
+    state, contract_hash = _base_state_with_contract(balance=1000 * COIN_VALUE)
+    same_asset = _ZERO_HASH
+    payload = _invoke_payload(
+        contract_hash,
+        deposits=[
+            {"asset": same_asset, "amount": COIN_VALUE},
+            {"asset": same_asset, "amount": COIN_VALUE * 2},
+        ],
+    )
+    tx = _mk_invoke_tx(payload)
     state_test_group(
         "transactions/contracts/invoke_contract.json",
         "invoke_contract_duplicate_deposit_assets",
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import pytest
+
 from tos_spec.config import (
     CHAIN_ID_DEVNET,
     CHAIN_ID_TESTNET,
     MAX_NONCE_GAP,
     MAX_TRANSFER_COUNT,
 )
-from tos_spec.test_accounts import ALICE, BOB
+from tos_spec.test_accounts import ALICE, BOB, CAROL, DAVE
 from tos_spec.types import (
     AccountState,
     ChainState,
@@ -18,12 +20,17 @@ from tos_spec.types import (
     TransferPayload,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+
+
+@state_factory
 def _base_state() -> ChainState:
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     state.accounts[ALICE] = AccountState(address=ALICE, balance=1_000_000, nonce=5)
@@ -37,59 +44,49 @@ def _mk_tx(sender: bytes, receiver: bytes, nonce: int, amount: int, fee: int) ->
         chain_id=CHAIN_ID_DEVNET,
         source=sender,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=receiver, amount=amount)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=receiver, amount=amount)],
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
-def test_transfer_success(state_test) -> None:
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=5, amount=100_000, fee=100_000)
-    state_test("transfer_success", state, tx)
-
-
-def test_transfer_exact_balance(state_test) -> None:
-    """Sender balance equals (sum(outputs) + fee)."""
-    state = _base_state()
-    amount = 900_000
-    fee = 100_000
-    state.accounts[ALICE].balance = amount + fee
-    tx = _mk_tx(ALICE, BOB, nonce=5, amount=amount, fee=fee)
-    state_test("transfer_exact_balance", state, tx)
-
-
-def test_transfer_insufficient_balance_after_fee(state_test) -> None:
-    """Sender balance covers outputs but not (outputs + fee)."""
-    state = _base_state()
-    amount = 900_000
-    fee = 100_000
-    state.accounts[ALICE].balance = amount + fee - 1
-    tx = _mk_tx(ALICE, BOB, nonce=5, amount=amount, fee=fee)
-    state_test("transfer_insufficient_balance_after_fee", state, tx)
-
-
-def test_nonce_too_high(state_test) -> None:
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=100, amount=100_000, fee=100_000)
-    state_test("nonce_too_high", state, tx)
-
-
-def test_insufficient_balance_execution_failure(state_test) -> None:
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=5, amount=2_000_000, fee=100_000)
-    state_test("insufficient_balance_execution_failure", state, tx)
-
-
-def test_transfer_self(state_test) -> None:
-    """Self-transfer (sender == recipient)."""
+# (case name, receiver, nonce, amount, fee, ALICE balance or None for the base
+# 1_000_000): plain single-output transfers from the base state.
+_TRANSFER_CASES = [
+    ("transfer_success", BOB, 5, 100_000, 100_000, None),
+    # Sender balance equals (sum(outputs) + fee) ...
+    ("transfer_exact_balance", BOB, 5, 900_000, 100_000, 1_000_000),
+    # ... or covers the outputs but not (outputs + fee).
+    ("transfer_insufficient_balance_after_fee", BOB, 5, 900_000, 100_000, 999_999),
+    ("nonce_too_high", BOB, 100, 100_000, 100_000, None),
+    ("insufficient_balance_execution_failure", BOB, 5, 2_000_000, 100_000, None),
+    ("transfer_self", ALICE, 5, 100_000, 100_000, None),
+]
+
+
+@pytest.mark.parametrize(
+    ("case", "receiver", "nonce", "amount", "fee", "balance"),
+    _TRANSFER_CASES,
+    ids=[c[0] for c in _TRANSFER_CASES],
+)
+def test_transfer(
+    state_test,
+    case: str,
+    receiver: bytes,
+    nonce: int,
+    amount: int,
+    fee: int,
+    balance: int | None,
+) -> None:
     state = _base_state()
-    tx = _mk_tx(ALICE, ALICE, nonce=5, amount=100_000, fee=100_000)
-    state_test("transfer_self", state, tx)
+    if balance is not None:
+        state.accounts[ALICE].balance = balance
+    tx = _mk_tx(ALICE, receiver, nonce=nonce, amount=amount, fee=fee)
+    state_test(case, state, tx)
 
 
 def test_transfer_empty_recipients(state_test) -> None:
@@ -104,7 +101,7 @@ def test_transfer_empty_recipients(state_test) -> None:
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -118,7 +115,7 @@ def test_transfer_max_count_exceeded(state_test) -> None:
         address=ALICE, balance=100_000_000, nonce=5
     )
     transfers = [
-        TransferPayload(asset=_hash(0), destination=BOB, amount=1)
+        TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=1)
         for _ in range(MAX_TRANSFER_COUNT + 1)
     ]
     tx = Transaction(
@@ -130,7 +127,7 @@ def test_transfer_max_count_exceeded(state_test) -> None:
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -146,12 +143,11 @@ def test_transfer_zero_amount(state_test) -> None:
 
 def test_transfer_multiple_recipients(state_test) -> None:
     """Two valid transfers to different recipients."""
-    from tos_spec.test_accounts import CAROL
     state = _base_state()
     state.accounts[CAROL] = AccountState(address=CAROL, balance=0, nonce=0)
     transfers = [
-        TransferPayload(asset=_hash(0), destination=BOB, amount=100_000),
-        TransferPayload(asset=_hash(0), destination=CAROL, amount=200_000),
+        TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=100_000),
+        TransferPayload(asset=_ZERO_HASH, destination=CAROL, amount=200_000),
     ]
     tx = Transaction(
         version=TxVersion.T1,
@@ -162,7 +158,7 @@ def test_transfer_multiple_recipients(state_test) -> None:
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -171,7 +167,6 @@ def test_transfer_multiple_recipients(state_test) -> None:
 
 def test_transfer_creates_new_account(state_test) -> None:
     """Transfer creates a new receiver account if it does not exist."""
-    from tos_spec.test_accounts import DAVE
 
     state = _base_state()
     # DAVE is not in pre-state.
@@ -187,32 +182,26 @@ def test_transfer_sender_missing(state_test) -> None:
     state_test("transfer_sender_missing", state, tx)
 
 
-def test_transfer_fee_zero_rejected(state_test) -> None:
-    """Transfers with fee=0 should fail min-fee validation."""
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=5, amount=100_000, fee=0)
-    state_test("transfer_fee_zero_rejected", state, tx)
-
-
-def test_nonce_too_low(state_test) -> None:
-    """Nonce below account nonce."""
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=3, amount=100_000, fee=100_000)
-    state_test("nonce_too_low", state, tx)
+# (case name, nonce, fee): a 100_000 transfer to BOB rejected on its nonce or
+# fee. ALICE's nonce is 5.
+_NONCE_FEE_CASES = [
+    ("transfer_fee_zero_rejected", 5, 0),  # fails min-fee validation
+    ("nonce_too_low", 3, 100_000),
+    ("nonce_gap_exceeded", 5 + MAX_NONCE_GAP + 1, 100_000),
+    # apply_tx enforces strict equality, so any nonce above 5 fails.
+    ("nonce_too_high_strict", 6, 100_000),
+]
 
 
-def test_nonce_gap_exceeded(state_test) -> None:
-    """Nonce gap exceeds MAX_NONCE_GAP (64)."""
-    state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=5 + MAX_NONCE_GAP + 1, amount=100_000, fee=100_000)
-    state_test("nonce_gap_exceeded", state, tx)
-
-
-def test_nonce_too_high_strict(state_test) -> None:
-    """Strict nonce: tx.nonce > sender.nonce (apply_tx enforces strict equality)."""
+@pytest.mark.parametrize(
+    ("case", "nonce", "fee"),
+    _NONCE_FEE_CASES,
+    ids=[c[0] for c in _NONCE_FEE_CASES],
+)
+def test_transfer_nonce_and_fee(state_test, case: str, nonce: int, fee: int) -> None:
     state = _base_state()
-    tx = _mk_tx(ALICE, BOB, nonce=6, amount=100_000, fee=100_000)
-    state_test("nonce_too_high_strict", state, tx)
+    tx = _mk_tx(ALICE, BOB, nonce=nonce, amount=100_000, fee=fee)
+    state_test(case, state, tx)
 
 
 # ===================================================================
@@ -233,8 +222,8 @@ def test_transfer_amount_overflow(state_test) -> None:
     )
     half = (U64_MAX // 2) + 1
     transfers = [
-        TransferPayload(asset=_hash(0), destination=BOB, amount=half),
-        TransferPayload(asset=_hash(0), destination=BOB, amount=half),
+        TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=half),
+        TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=half),
     ]
     tx = Transaction(
         version=TxVersion.T1,
@@ -245,7 +234,7 @@ def test_transfer_amount_overflow(state_test) -> None:
         fee=0,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -266,11 +255,11 @@ def test_transfer_amount_plus_fee_overflow(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=U64_MAX)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=U64_MAX)],
         fee=1,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -285,11 +274,11 @@ def test_burn_zero_amount(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": 0, "asset": _hash(0)},
+        payload={"amount": 0, "asset": _ZERO_HASH},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -304,11 +293,11 @@ def test_burn_amount_exceeds_balance(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": 2_000_000, "asset": _hash(0)},
+        payload={"amount": 2_000_000, "asset": _ZERO_HASH},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -339,11 +328,11 @@ def test_burn_total_burned_overflow(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": 100, "asset": _hash(0)},
+        payload={"amount": 100, "asset": _ZERO_HASH},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -366,11 +355,11 @@ def test_chain_id_mismatch(state_test) -> None:
         chain_id=CHAIN_ID_TESTNET,  # Wrong: state uses DEVNET
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100_000)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=100_000)],
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -465,11 +454,11 @@ def test_burn_amount_plus_fee_overflow(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": U64_MAX, "asset": _hash(0)},
+        payload={"amount": U64_MAX, "asset": _ZERO_HASH},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -484,11 +473,11 @@ def test_burn_success(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": 100_000, "asset": _hash(0)},
+        payload={"amount": 100_000, "asset": _ZERO_HASH},
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -511,11 +500,11 @@ def test_energy_fee_type_nonzero_fee(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.TRANSFERS,
-        payload=[TransferPayload(asset=_hash(0), destination=BOB, amount=100)],
+        payload=[TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=100)],
         fee=1000,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -533,11 +522,11 @@ def test_energy_fee_type_invalid_tx(state_test) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.BURN,
-        payload={"amount": 100_000, "asset": _hash(0)},
+        payload={"amount": 100_000, "asset": _ZERO_HASH},
         fee=0,
         fee_type=FeeType.ENERGY,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -551,7 +540,7 @@ def test_transfer_max_count_exact(state_test) -> None:
         address=ALICE, balance=1_000_000_000, nonce=5
     )
     transfers = [
-        TransferPayload(asset=_hash(0), destination=BOB, amount=1)
+        TransferPayload(asset=_ZERO_HASH, destination=BOB, amount=1)
         for _ in range(MAX_TRANSFER_COUNT)
     ]
     tx = Transaction(
@@ -563,7 +552,7 @@ def test_transfer_max_count_exact(state_test) -> None:
         fee=3_000_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
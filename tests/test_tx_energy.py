@@ -18,12 +18,22 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_REFERENCE_HASH = _hash(0)
+
+# The common delegatee entries. Transaction payloads are read-only to
+# apply_tx and the encoders, so tests can share one instance.
+_BOB_ENTRY = DelegationEntry(delegatee=BOB, amount=COIN_VALUE)
+_CAROL_ENTRY = DelegationEntry(delegatee=CAROL, amount=COIN_VALUE)
+
+
+@state_factory
 def _base_state() -> ChainState:
     sender = ALICE
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
@@ -45,6 +55,22 @@ def _base_state() -> ChainState:
     return state
 
 
+@state_factory
+def _base_state_with_bob() -> ChainState:
+    """Base state plus an empty BOB account, the usual delegatee."""
+    state = _base_state()
+    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    return state
+
+
+@state_factory
+def _unlocked_state() -> ChainState:
+    """Base state whose freeze record can be unfrozen right away."""
+    state = _base_state()
+    state.energy_resources[ALICE].freeze_records[0].unlock_height = 0
+    return state
+
+
 def _mk_freeze_tos(
     sender: bytes, nonce: int, amount: int, days: int, fee: int
 ) -> Transaction:
@@ -61,7 +87,7 @@ def _mk_freeze_tos(
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -87,7 +113,7 @@ def _mk_freeze_delegate(
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -113,7 +139,7 @@ def _mk_unfreeze_tos(
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -129,7 +155,7 @@ def _mk_withdraw_unfrozen(sender: bytes, nonce: int, fee: int) -> Transaction:
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -208,11 +234,9 @@ def test_freeze_tos_zero_amount(state_test_group) -> None:
 
 
 def test_freeze_delegate_success(state_test_group) -> None:
-    state = _base_state()
+    state = _base_state_with_bob()
     sender = ALICE
-    delegatee = BOB
-    state.accounts[delegatee] = AccountState(address=delegatee, balance=0, nonce=0)
-    entries = [DelegationEntry(delegatee=delegatee, amount=COIN_VALUE)]
+    entries = [_BOB_ENTRY]
     tx = _mk_freeze_delegate(sender, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -251,10 +275,8 @@ def test_freeze_delegate_empty(state_test_group) -> None:
 
 
 def test_unfreeze_tos_success(state_test_group) -> None:
-    state = _base_state()
+    state = _unlocked_state()
     sender = ALICE
-    # Override unlock_height to 0 so the record is unlockable at topoheight=0
-    state.energy_resources[sender].freeze_records[0].unlock_height = 0
     tx = _mk_unfreeze_tos(
         sender, nonce=5, amount=MIN_UNFREEZE_TOS_AMOUNT, from_delegation=False, fee=0
     )
@@ -264,10 +286,8 @@ def test_unfreeze_tos_success(state_test_group) -> None:
 
 
 def test_unfreeze_tos_nonce_too_low(state_test_group) -> None:
-    state = _base_state()
+    state = _unlocked_state()
     sender = ALICE
-    # Override unlock_height to 0 so the record is unlockable at topoheight=0
-    state.energy_resources[sender].freeze_records[0].unlock_height = 0
     tx = _mk_unfreeze_tos(
         sender, nonce=4, amount=MIN_UNFREEZE_TOS_AMOUNT, from_delegation=False, fee=0
     )
@@ -280,10 +300,8 @@ def test_unfreeze_tos_nonce_too_low(state_test_group) -> None:
 
 
 def test_unfreeze_tos_nonce_too_high_strict(state_test_group) -> None:
-    state = _base_state()
+    state = _unlocked_state()
     sender = ALICE
-    # Override unlock_height to 0 so the record is unlockable at topoheight=0
-    state.energy_resources[sender].freeze_records[0].unlock_height = 0
     tx = _mk_unfreeze_tos(
         sender, nonce=6, amount=MIN_UNFREEZE_TOS_AMOUNT, from_delegation=False, fee=0
     )
@@ -296,10 +314,8 @@ def test_unfreeze_tos_nonce_too_high_strict(state_test_group) -> None:
 
 
 def test_unfreeze_tos_insufficient_frozen(state_test_group) -> None:
-    state = _base_state()
+    state = _unlocked_state()
     sender = ALICE
-    # Override unlock_height to 0 so the record is unlockable at topoheight=0
-    state.energy_resources[sender].freeze_records[0].unlock_height = 0
     tx = _mk_unfreeze_tos(
         sender, nonce=5, amount=50 * COIN_VALUE, from_delegation=False, fee=0
     )
@@ -383,20 +399,35 @@ def test_freeze_duration_too_long(state_test_group) -> None:
 # --- freeze_delegate boundary tests ---
 
 
+# MAX_DELEGATEES + 1 distinct delegatees, shared read-only by the tests.
+_TOO_MANY_ENTRIES = [
+    DelegationEntry(
+        delegatee=bytes([i % 256, (i >> 8) % 256]) + bytes(30), amount=COIN_VALUE
+    )
+    for i in range(MAX_DELEGATEES + 1)
+]
+
+
+@state_factory
+def _too_many_delegatees_state() -> ChainState:
+    state = _base_state()
+    for entry in _TOO_MANY_ENTRIES:
+        state.accounts[entry.delegatee] = AccountState(
+            address=entry.delegatee, balance=0, nonce=0
+        )
+    return state
+
+
 def test_freeze_delegate_max_delegatees_exceeded(state_test_group) -> None:
     """501 delegatees (max=500)."""
-    state = _base_state()
+    state = _too_many_delegatees_state()
     sender = ALICE
     state.accounts[sender] = AccountState(
         address=sender, balance=1000 * COIN_VALUE, nonce=5, frozen=10 * COIN_VALUE
     )
-    # Create distinct delegatee accounts
-    delegatees = []
-    for i in range(MAX_DELEGATEES + 1):
-        addr = bytes([i % 256, (i >> 8) % 256]) + bytes(30)
-        state.accounts[addr] = AccountState(address=addr, balance=0, nonce=0)
-        delegatees.append(DelegationEntry(delegatee=addr, amount=COIN_VALUE))
-    tx = _mk_freeze_delegate(sender, nonce=5, delegatees=delegatees, days=7, fee=0)
+    tx = _mk_freeze_delegate(
+        sender, nonce=5, delegatees=_TOO_MANY_ENTRIES, days=7, fee=0
+    )
     state_test_group(
         "transactions/energy/freeze_delegate.json",
         "freeze_delegate_max_delegatees_exceeded",
@@ -504,14 +535,10 @@ def test_delegate_max_delegatees_exceeded(state_test_group) -> None:
 
     Rust: "Too many delegatees (max 500)"
     """
-    state = _base_state()
-    # Create 501 unique delegatees
-    delegatees = []
-    for i in range(MAX_DELEGATEES + 1):
-        addr = bytes([i % 256]) + bytes([(i >> 8) % 256]) + bytes(30)
-        state.accounts[addr] = AccountState(address=addr, balance=0, nonce=0)
-        delegatees.append(DelegationEntry(delegatee=addr, amount=COIN_VALUE))
-    tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=delegatees, days=7, fee=0)
+    state = _too_many_delegatees_state()
+    tx = _mk_freeze_delegate(
+        ALICE, nonce=5, delegatees=_TOO_MANY_ENTRIES, days=7, fee=0
+    )
     state_test_group(
         "transactions/energy/freeze_delegate.json",
         "delegate_max_delegatees_exceeded",
@@ -595,7 +622,7 @@ def test_delegate_energy_overflow(state_test_group) -> None:
         address=delegatee, balance=0, nonce=0, energy=U64_MAX - 5,
     )
     state.global_state.total_energy = U64_MAX - 5
-    entries = [DelegationEntry(delegatee=delegatee, amount=COIN_VALUE)]
+    entries = [_BOB_ENTRY]
     tx = _mk_freeze_delegate(sender, nonce=5, delegatees=entries, days=3, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -650,9 +677,8 @@ def test_freeze_tos_nonzero_fee(state_test_group) -> None:
 
 def test_freeze_delegate_nonzero_fee(state_test_group) -> None:
     """Delegate with fee != 0 should be rejected."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    entries = [DelegationEntry(delegatee=BOB, amount=COIN_VALUE)]
+    state = _base_state_with_bob()
+    entries = [_BOB_ENTRY]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=7, fee=100)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -664,8 +690,7 @@ def test_freeze_delegate_nonzero_fee(state_test_group) -> None:
 
 def test_unfreeze_tos_nonzero_fee(state_test_group) -> None:
     """Unfreeze with fee != 0 should be rejected."""
-    state = _base_state()
-    state.energy_resources[ALICE].freeze_records[0].unlock_height = 0
+    state = _unlocked_state()
     tx = _mk_unfreeze_tos(ALICE, nonce=5, amount=COIN_VALUE, from_delegation=False, fee=100)
     state_test_group(
         "transactions/energy/unfreeze_tos.json",
@@ -700,11 +725,10 @@ def test_freeze_delegate_duplicate_delegatees(state_test_group) -> None:
 
     Rust: "Duplicate delegatee in list".
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     entries = [
-        DelegationEntry(delegatee=BOB, amount=COIN_VALUE),
-        DelegationEntry(delegatee=BOB, amount=COIN_VALUE),
+        _BOB_ENTRY,
+        _BOB_ENTRY,
     ]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
@@ -737,8 +761,7 @@ def test_freeze_delegate_zero_amount(state_test_group) -> None:
 
     Rust: "Delegation amount must be greater than zero".
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     entries = [DelegationEntry(delegatee=BOB, amount=0)]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
@@ -754,8 +777,7 @@ def test_freeze_delegate_non_whole_tos(state_test_group) -> None:
 
     Rust: "Delegation amount must be a whole number of TOS".
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     entries = [DelegationEntry(delegatee=BOB, amount=COIN_VALUE + COIN_VALUE // 2)]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
@@ -771,8 +793,7 @@ def test_freeze_delegate_below_minimum(state_test_group) -> None:
 
     Rust: "Delegation amount must be at least 1 TOS".
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     entries = [DelegationEntry(delegatee=BOB, amount=MIN_FREEZE_TOS_AMOUNT // 2)]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
@@ -783,22 +804,23 @@ def test_freeze_delegate_below_minimum(state_test_group) -> None:
     )
 
 
+def _two_delegatee_state(balance: int) -> ChainState:
+    """ALICE with ``balance`` and nothing frozen, plus empty BOB and CAROL."""
+    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
+    state.accounts[ALICE] = AccountState(address=ALICE, balance=balance, nonce=5)
+    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state.accounts[CAROL] = AccountState(address=CAROL, balance=0, nonce=0)
+    return state
+
+
 def test_freeze_delegate_insufficient_balance(state_test_group) -> None:
     """Total delegation amount exceeds sender balance.
 
     Rust: InsufficientFunds.
     """
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
+    state = _two_delegatee_state(balance=COIN_VALUE)
     sender = ALICE
-    state.accounts[sender] = AccountState(
-        address=sender, balance=COIN_VALUE, nonce=5
-    )
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    state.accounts[CAROL] = AccountState(address=CAROL, balance=0, nonce=0)
-    entries = [
-        DelegationEntry(delegatee=BOB, amount=COIN_VALUE),
-        DelegationEntry(delegatee=CAROL, amount=COIN_VALUE),
-    ]
+    entries = [_BOB_ENTRY, _CAROL_ENTRY]
     tx = _mk_freeze_delegate(sender, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -810,17 +832,9 @@ def test_freeze_delegate_insufficient_balance(state_test_group) -> None:
 
 def test_freeze_delegate_exact_balance(state_test_group) -> None:
     """Sender balance exactly equals total delegated amount (fee is always 0)."""
-    state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
+    state = _two_delegatee_state(balance=2 * COIN_VALUE)
     sender = ALICE
-    state.accounts[sender] = AccountState(
-        address=sender, balance=2 * COIN_VALUE, nonce=5
-    )
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    state.accounts[CAROL] = AccountState(address=CAROL, balance=0, nonce=0)
-    entries = [
-        DelegationEntry(delegatee=BOB, amount=COIN_VALUE),
-        DelegationEntry(delegatee=CAROL, amount=COIN_VALUE),
-    ]
+    entries = [_BOB_ENTRY, _CAROL_ENTRY]
     tx = _mk_freeze_delegate(sender, nonce=5, delegatees=entries, days=7, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -832,9 +846,8 @@ def test_freeze_delegate_exact_balance(state_test_group) -> None:
 
 def test_freeze_delegate_duration_too_short(state_test_group) -> None:
     """Delegation duration below minimum (2 days < 3)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    entries = [DelegationEntry(delegatee=BOB, amount=COIN_VALUE)]
+    state = _base_state_with_bob()
+    entries = [_BOB_ENTRY]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=2, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -846,9 +859,8 @@ def test_freeze_delegate_duration_too_short(state_test_group) -> None:
 
 def test_freeze_delegate_duration_too_long(state_test_group) -> None:
     """Delegation duration above maximum (366 days > 365)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    entries = [DelegationEntry(delegatee=BOB, amount=COIN_VALUE)]
+    state = _base_state_with_bob()
+    entries = [_BOB_ENTRY]
     tx = _mk_freeze_delegate(ALICE, nonce=5, delegatees=entries, days=366, fee=0)
     state_test_group(
         "transactions/energy/freeze_delegate.json",
@@ -868,8 +880,7 @@ def test_unfreeze_non_whole_tos(state_test_group) -> None:
 
     Rust: "Unfreeze amount must be a whole number of TOS".
     """
-    state = _base_state()
-    state.energy_resources[ALICE].freeze_records[0].unlock_height = 0
+    state = _unlocked_state()
     tx = _mk_unfreeze_tos(
         ALICE, nonce=5, amount=COIN_VALUE + COIN_VALUE // 2,
         from_delegation=False, fee=0,
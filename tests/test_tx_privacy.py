@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+
+import pytest
 import tos_signer
 from tos_spec.config import (
     CHAIN_ID_DEVNET,
@@ -18,6 +21,7 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
 
 # Seed bytes for key derivation (must match test_accounts.py)
 _SEED_ALICE = 2
@@ -28,6 +32,16 @@ def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_ZERO_HASH = _hash(0)
+
+# COIN_VALUE multiples, computed once at import.
+_BASE_BALANCE = 1000 * COIN_VALUE
+_TRANSFER_AMOUNT = 5 * COIN_VALUE
+
+# Shared by the empty-list cases of all three privacy txs; nothing mutates it.
+_EMPTY_TRANSFERS = {"transfers": []}
+
+
 def _valid_point() -> bytes:
     """Generate a random valid compressed Ristretto point (32 bytes)."""
     return bytes(tos_signer.random_valid_point())
@@ -38,14 +52,34 @@ def _valid_ct_proof() -> bytes:
     return bytes(tos_signer.make_dummy_ct_validity_proof())
 
 
+@functools.lru_cache(maxsize=None)
+def _shield_crypto(dest_seed: int, amount: int) -> tuple[bytes, bytes, bytes]:
+    """(commitment, receiver_handle, proof) for shielding ``amount`` to ``dest_seed``.
+
+    make_shield_crypto sees nothing but these two arguments, so a triple is
+    valid wherever the same pair is shielded; prove once per pair.
+    """
+    commitment, receiver_handle, proof = tos_signer.make_shield_crypto(dest_seed, amount)
+    return bytes(commitment), bytes(receiver_handle), bytes(proof)
+
+
+@state_factory
 def _base_state() -> ChainState:
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     state.accounts[ALICE] = AccountState(
-        address=ALICE, balance=1000 * COIN_VALUE, nonce=5
+        address=ALICE, balance=_BASE_BALANCE, nonce=5
     )
     return state
 
 
+@state_factory
+def _base_state_with_bob() -> ChainState:
+    """Base state plus an empty BOB account, the usual recipient."""
+    state = _base_state()
+    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    return state
+
+
 def _mk_uno_transfer(
     sender: bytes, nonce: int, destination: bytes, fee: int
 ) -> Transaction:
@@ -57,7 +91,7 @@ def _mk_uno_transfer(
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": destination,
                     "commitment": _valid_point(),
                     "sender_handle": _valid_point(),
@@ -70,7 +104,7 @@ def _mk_uno_transfer(
         fee_type=FeeType.UNO,
         nonce=nonce,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -80,9 +114,7 @@ def _mk_shield_transfer(
     sender: bytes, nonce: int, destination: bytes, amount: int, fee: int,
     dest_seed: int = _SEED_BOB,
 ) -> Transaction:
-    commitment, receiver_handle, proof = [
-        bytes(x) for x in tos_signer.make_shield_crypto(dest_seed, amount)
-    ]
+    commitment, receiver_handle, proof = _shield_crypto(dest_seed, amount)
     return Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
@@ -91,7 +123,7 @@ def _mk_shield_transfer(
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": destination,
                     "amount": amount,
                     "commitment": commitment,
@@ -104,7 +136,7 @@ def _mk_shield_transfer(
         fee_type=FeeType.TOS,
         nonce=nonce,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -121,7 +153,7 @@ def _mk_unshield_transfer(
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": destination,
                     "amount": amount,
                     "commitment": _valid_point(),
@@ -134,18 +166,26 @@ def _mk_unshield_transfer(
         fee_type=FeeType.TOS,
         nonce=nonce,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
 
 
+# (case suffix, nonce) against ALICE's nonce of 5: a stale nonce and one that
+# skips ahead must both fail under strict nonce ordering.
+_NONCE_CASES = [
+    ("nonce_too_low", 4),
+    ("nonce_too_high_strict", 6),
+]
+_SUCCESS_AND_NONCE_CASES = [("success", 5), *_NONCE_CASES]
+
+
 # --- uno_transfers specs ---
 
 
 def test_uno_transfer_success(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = _mk_uno_transfer(ALICE, nonce=5, destination=BOB, fee=0)
     state_test_group(
         "transactions/privacy/uno_transfers.json",
@@ -166,27 +206,17 @@ def test_uno_transfer_self(state_test_group) -> None:
     )
 
 
-def test_uno_transfer_nonce_too_low(state_test_group) -> None:
-    """UNO transfer with nonce below sender.nonce must fail."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_uno_transfer(ALICE, nonce=4, destination=BOB, fee=0)
-    state_test_group(
-        "transactions/privacy/uno_transfers.json",
-        "uno_transfer_nonce_too_low",
-        state,
-        tx,
-    )
-
-
-def test_uno_transfer_nonce_too_high_strict(state_test_group) -> None:
-    """UNO transfer with nonce above sender.nonce must fail (strict nonce)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_uno_transfer(ALICE, nonce=6, destination=BOB, fee=0)
+@pytest.mark.parametrize(
+    ("case", "nonce"),
+    _NONCE_CASES,
+    ids=[c[0] for c in _NONCE_CASES],
+)
+def test_uno_transfer_nonce(state_test_group, case: str, nonce: int) -> None:
+    state = _base_state_with_bob()
+    tx = _mk_uno_transfer(ALICE, nonce=nonce, destination=BOB, fee=0)
     state_test_group(
         "transactions/privacy/uno_transfers.json",
-        "uno_transfer_nonce_too_high_strict",
+        f"uno_transfer_{case}",
         state,
         tx,
     )
@@ -195,51 +225,26 @@ def test_uno_transfer_nonce_too_high_strict(state_test_group) -> None:
 # --- shield_transfers specs ---
 
 
-def test_shield_transfer_success(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_shield_transfer(
-        ALICE, nonce=5, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
-    )
-    state_test_group(
-        "transactions/privacy/shield_transfers.json",
-        "shield_transfer_success",
-        state,
-        tx,
-    )
-
-
-def test_shield_transfer_nonce_too_low(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_shield_transfer(
-        ALICE, nonce=4, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
-    )
-    state_test_group(
-        "transactions/privacy/shield_transfers.json",
-        "shield_transfer_nonce_too_low",
-        state,
-        tx,
-    )
-
-
-def test_shield_transfer_nonce_too_high_strict(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+@pytest.mark.parametrize(
+    ("case", "nonce"),
+    _SUCCESS_AND_NONCE_CASES,
+    ids=[c[0] for c in _SUCCESS_AND_NONCE_CASES],
+)
+def test_shield_transfer_nonce(state_test_group, case: str, nonce: int) -> None:
+    state = _base_state_with_bob()
     tx = _mk_shield_transfer(
-        ALICE, nonce=6, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
+        ALICE, nonce=nonce, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
     )
     state_test_group(
         "transactions/privacy/shield_transfers.json",
-        "shield_transfer_nonce_too_high_strict",
+        f"shield_transfer_{case}",
         state,
         tx,
     )
 
 
 def test_shield_transfer_below_minimum(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = _mk_shield_transfer(
         ALICE, nonce=5, destination=BOB, amount=COIN_VALUE, fee=100_000
     )
@@ -254,43 +259,19 @@ def test_shield_transfer_below_minimum(state_test_group) -> None:
 # --- unshield_transfers specs ---
 
 
-def test_unshield_transfer_success(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_unshield_transfer(
-        ALICE, nonce=5, destination=BOB, amount=5 * COIN_VALUE, fee=100_000
-    )
-    state_test_group(
-        "transactions/privacy/unshield_transfers.json",
-        "unshield_transfer_success",
-        state,
-        tx,
-    )
-
-
-def test_unshield_transfer_nonce_too_low(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    tx = _mk_unshield_transfer(
-        ALICE, nonce=4, destination=BOB, amount=5 * COIN_VALUE, fee=100_000
-    )
-    state_test_group(
-        "transactions/privacy/unshield_transfers.json",
-        "unshield_transfer_nonce_too_low",
-        state,
-        tx,
-    )
-
-
-def test_unshield_transfer_nonce_too_high_strict(state_test_group) -> None:
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+@pytest.mark.parametrize(
+    ("case", "nonce"),
+    _SUCCESS_AND_NONCE_CASES,
+    ids=[c[0] for c in _SUCCESS_AND_NONCE_CASES],
+)
+def test_unshield_transfer_nonce(state_test_group, case: str, nonce: int) -> None:
+    state = _base_state_with_bob()
     tx = _mk_unshield_transfer(
-        ALICE, nonce=6, destination=BOB, amount=5 * COIN_VALUE, fee=100_000
+        ALICE, nonce=nonce, destination=BOB, amount=_TRANSFER_AMOUNT, fee=100_000
     )
     state_test_group(
         "transactions/privacy/unshield_transfers.json",
-        "unshield_transfer_nonce_too_high_strict",
+        f"unshield_transfer_{case}",
         state,
         tx,
     )
@@ -298,8 +279,7 @@ def test_unshield_transfer_nonce_too_high_strict(state_test_group) -> None:
 
 def test_shield_transfer_zero_amount(state_test_group) -> None:
     """Shield 0 TOS."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = _mk_shield_transfer(
         ALICE, nonce=5, destination=BOB, amount=0, fee=100_000
     )
@@ -315,7 +295,7 @@ def test_unshield_transfer_self(state_test_group) -> None:
     """Unshield to self."""
     state = _base_state()
     tx = _mk_unshield_transfer(
-        ALICE, nonce=5, destination=ALICE, amount=5 * COIN_VALUE, fee=100_000
+        ALICE, nonce=5, destination=ALICE, amount=_TRANSFER_AMOUNT, fee=100_000
     )
     state_test_group(
         "transactions/privacy/unshield_transfers.json",
@@ -342,8 +322,7 @@ def test_uno_transfer_insufficient_balance(state_test_group) -> None:
 
 def test_unshield_transfer_zero_amount(state_test_group) -> None:
     """Unshield with zero amount."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = _mk_unshield_transfer(
         ALICE, nonce=5, destination=BOB, amount=0, fee=100_000
     )
@@ -411,8 +390,7 @@ def test_shield_transfer_insufficient_balance_after_fee(state_test_group) -> Non
 
 def test_shield_transfer_exact_minimum(state_test_group) -> None:
     """Shield exactly MIN_SHIELD_TOS_AMOUNT (100 TOS). Privacy stub returns INVALID_FORMAT."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = _mk_shield_transfer(
         ALICE, nonce=5, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
     )
@@ -426,8 +404,7 @@ def test_shield_transfer_exact_minimum(state_test_group) -> None:
 
 def test_uno_transfer_zero_amount(state_test_group) -> None:
     """UNO transfer with zero-valued commitment."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
@@ -436,7 +413,7 @@ def test_uno_transfer_zero_amount(state_test_group) -> None:
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": BOB,
                     "commitment": bytes(32),  # zero commitment
                     "sender_handle": _valid_point(),
@@ -449,7 +426,7 @@ def test_uno_transfer_zero_amount(state_test_group) -> None:
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -477,12 +454,12 @@ def test_uno_transfer_empty_list(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.UNO_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=0,
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -499,15 +476,14 @@ def test_uno_transfer_max_count_exceeded(state_test_group) -> None:
 
     Rust: TransferCount error.
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     commitment = _valid_point()
     sender_handle = _valid_point()
     receiver_handle = _valid_point()
     ct_proof = _valid_ct_proof()
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
             "commitment": commitment,
             "sender_handle": sender_handle,
@@ -526,7 +502,7 @@ def test_uno_transfer_max_count_exceeded(state_test_group) -> None:
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -540,15 +516,14 @@ def test_uno_transfer_max_count_exceeded(state_test_group) -> None:
 
 def test_uno_transfer_max_count_exact(state_test_group) -> None:
     """UNO transfers at MAX_TRANSFER_COUNT boundary (500)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     commitment = _valid_point()
     sender_handle = _valid_point()
     receiver_handle = _valid_point()
     ct_proof = _valid_ct_proof()
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
             "commitment": commitment,
             "sender_handle": sender_handle,
@@ -567,7 +542,7 @@ def test_uno_transfer_max_count_exact(state_test_group) -> None:
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -595,11 +570,11 @@ def test_shield_transfer_empty_list(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.SHIELD_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -616,14 +591,11 @@ def test_shield_transfer_max_count_exceeded(state_test_group) -> None:
 
     Rust: TransferCount error.
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    commitment, receiver_handle, proof = [
-        bytes(x) for x in tos_signer.make_shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
-    ]
+    state = _base_state_with_bob()
+    commitment, receiver_handle, proof = _shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
             "amount": MIN_SHIELD_TOS_AMOUNT,
             "commitment": commitment,
@@ -641,7 +613,7 @@ def test_shield_transfer_max_count_exceeded(state_test_group) -> None:
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -655,16 +627,13 @@ def test_shield_transfer_max_count_exceeded(state_test_group) -> None:
 
 def test_shield_transfer_max_count_exact(state_test_group) -> None:
     """Shield transfers at MAX_TRANSFER_COUNT boundary (500)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     # Must be able to cover total_amount in verification (fee is checked separately).
-    state.accounts[ALICE].balance = MAX_TRANSFER_COUNT * MIN_SHIELD_TOS_AMOUNT + 1000 * COIN_VALUE
-    commitment, receiver_handle, proof = [
-        bytes(x) for x in tos_signer.make_shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
-    ]
+    state.accounts[ALICE].balance = MAX_TRANSFER_COUNT * MIN_SHIELD_TOS_AMOUNT + _BASE_BALANCE
+    commitment, receiver_handle, proof = _shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
             "amount": MIN_SHIELD_TOS_AMOUNT,
             "commitment": commitment,
@@ -686,7 +655,7 @@ def test_shield_transfer_max_count_exact(state_test_group) -> None:
         fee=1_500_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -700,9 +669,8 @@ def test_shield_transfer_max_count_exact(state_test_group) -> None:
 
 def test_shield_transfer_insufficient_fee(state_test_group) -> None:
     """Shield transfer with balance below fee must fail: INSUFFICIENT_FEE (pre-check)."""
-    state = _base_state()
+    state = _base_state_with_bob()
     state.accounts[ALICE].balance = 99_999
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
     tx = _mk_shield_transfer(
         ALICE, nonce=5, destination=BOB, amount=MIN_SHIELD_TOS_AMOUNT, fee=100_000
     )
@@ -719,11 +687,8 @@ def test_shield_transfer_non_tos_asset(state_test_group) -> None:
 
     Rust: "Shield transfers only support TOS asset".
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    commitment, receiver_handle, proof = [
-        bytes(x) for x in tos_signer.make_shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
-    ]
+    state = _base_state_with_bob()
+    commitment, receiver_handle, proof = _shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
@@ -745,7 +710,7 @@ def test_shield_transfer_non_tos_asset(state_test_group) -> None:
         fee_type=FeeType.TOS,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -773,11 +738,11 @@ def test_unshield_transfer_empty_list(state_test_group) -> None:
         chain_id=CHAIN_ID_DEVNET,
         source=ALICE,
         tx_type=TransactionType.UNSHIELD_TRANSFERS,
-        payload={"transfers": []},
+        payload=_EMPTY_TRANSFERS,
         fee=100_000,
         fee_type=FeeType.TOS,
         nonce=5,
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -794,16 +759,15 @@ def test_unshield_transfer_max_count_exceeded(state_test_group) -> None:
 
     Rust: TransferCount error.
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     commitment = _valid_point()
     sender_handle = _valid_point()
     ct_proof = _valid_ct_proof()
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
-            "amount": 5 * COIN_VALUE,
+            "amount": _TRANSFER_AMOUNT,
             "commitment": commitment,
             "sender_handle": sender_handle,
             "ct_validity_proof": ct_proof,
@@ -820,7 +784,7 @@ def test_unshield_transfer_max_count_exceeded(state_test_group) -> None:
         fee_type=FeeType.TOS,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -834,16 +798,15 @@ def test_unshield_transfer_max_count_exceeded(state_test_group) -> None:
 
 def test_unshield_transfer_max_count_exact(state_test_group) -> None:
     """Unshield transfers at MAX_TRANSFER_COUNT boundary (500)."""
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     commitment = _valid_point()
     sender_handle = _valid_point()
     ct_proof = _valid_ct_proof()
     transfers = [
         {
-            "asset": _hash(0),
+            "asset": _ZERO_HASH,
             "destination": BOB,
-            "amount": 5 * COIN_VALUE,
+            "amount": _TRANSFER_AMOUNT,
             "commitment": commitment,
             "sender_handle": sender_handle,
             "ct_validity_proof": ct_proof,
@@ -860,7 +823,7 @@ def test_unshield_transfer_max_count_exact(state_test_group) -> None:
         fee_type=FeeType.TOS,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -874,11 +837,10 @@ def test_unshield_transfer_max_count_exact(state_test_group) -> None:
 
 def test_unshield_transfer_insufficient_fee(state_test_group) -> None:
     """Unshield transfer with balance below fee must fail: INSUFFICIENT_FEE (pre-check)."""
-    state = _base_state()
+    state = _base_state_with_bob()
     state.accounts[ALICE].balance = 99_999
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
     tx = _mk_unshield_transfer(
-        ALICE, nonce=5, destination=BOB, amount=5 * COIN_VALUE, fee=100_000
+        ALICE, nonce=5, destination=BOB, amount=_TRANSFER_AMOUNT, fee=100_000
     )
     state_test_group(
         "transactions/privacy/unshield_transfers.json",
@@ -898,11 +860,8 @@ def test_uno_fee_type_invalid_tx(state_test_group) -> None:
 
     Rust: InvalidFormat.
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
-    commitment, receiver_handle, proof = [
-        bytes(x) for x in tos_signer.make_shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
-    ]
+    state = _base_state_with_bob()
+    commitment, receiver_handle, proof = _shield_crypto(_SEED_BOB, MIN_SHIELD_TOS_AMOUNT)
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
@@ -911,7 +870,7 @@ def test_uno_fee_type_invalid_tx(state_test_group) -> None:
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": BOB,
                     "amount": MIN_SHIELD_TOS_AMOUNT,
                     "commitment": commitment,
@@ -924,7 +883,7 @@ def test_uno_fee_type_invalid_tx(state_test_group) -> None:
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -941,8 +900,7 @@ def test_uno_fee_nonzero(state_test_group) -> None:
 
     Rust: InvalidFee(0, self.fee).
     """
-    state = _base_state()
-    state.accounts[BOB] = AccountState(address=BOB, balance=0, nonce=0)
+    state = _base_state_with_bob()
     tx = Transaction(
         version=TxVersion.T1,
         chain_id=CHAIN_ID_DEVNET,
@@ -951,7 +909,7 @@ def test_uno_fee_nonzero(state_test_group) -> None:
         payload={
             "transfers": [
                 {
-                    "asset": _hash(0),
+                    "asset": _ZERO_HASH,
                     "destination": BOB,
                     "commitment": _valid_point(),
                     "sender_handle": _valid_point(),
@@ -964,7 +922,7 @@ def test_uno_fee_nonzero(state_test_group) -> None:
         fee_type=FeeType.UNO,
         nonce=5,
         source_commitments=[],
-        reference_hash=_hash(0),
+        reference_hash=_ZERO_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from tos_spec.config import (
     CHAIN_ID_DEVNET,
     COIN_VALUE,
@@ -19,12 +21,22 @@ from tos_spec.types import (
     TransactionType,
     TxVersion,
 )
+from tools.fixtures_io import state_factory
+
+# Boundary-length names, built once at import.
+_MIN_LENGTH_NAME = "a" * MIN_NAME_LENGTH
+_MAX_LENGTH_NAME = "a" * MAX_NAME_LENGTH
+_TOO_LONG_NAME = "a" * (MAX_NAME_LENGTH + 1)
 
 
 def _hash(byte: int) -> bytes:
     return bytes([byte]) * 32
 
 
+_REFERENCE_HASH = _hash(0)
+
+
+@state_factory
 def _base_state() -> ChainState:
     state = ChainState(network_chain_id=CHAIN_ID_DEVNET)
     state.accounts[ALICE] = AccountState(address=ALICE, balance=COIN_VALUE, nonce=5)
@@ -41,7 +53,7 @@ def _mk_register_name(sender: bytes, nonce: int, name: str, fee: int) -> Transac
         fee=fee,
         fee_type=FeeType.TOS,
         nonce=nonce,
-        reference_hash=_hash(0),
+        reference_hash=_REFERENCE_HASH,
         reference_topoheight=0,
         signature=bytes(64),
     )
@@ -75,115 +87,32 @@ def test_register_name_nonce_too_high_strict(state_test_group) -> None:
     )
 
 
-def test_register_name_too_short(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="ab", fee=REGISTRATION_FEE)
-    state_test_group("transactions/tns/register_name.json", "register_name_too_short", state, tx)
-
-
-def test_register_name_too_long(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="a" * (MAX_NAME_LENGTH + 1), fee=REGISTRATION_FEE)
-    state_test_group("transactions/tns/register_name.json", "register_name_too_long", state, tx)
-
-
-def test_register_name_min_length(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="a" * MIN_NAME_LENGTH, fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_min_length",
-        state,
-        tx,
-    )
-
-
-def test_register_name_exact_max_length(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="a" * MAX_NAME_LENGTH, fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_exact_max_length",
-        state,
-        tx,
-    )
-
-
-def test_register_name_invalid_starts_with_digit(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="1alice", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_starts_with_digit",
-        state,
-        tx,
-    )
-
-
-def test_register_name_invalid_ends_with_separator(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="alice.", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_ends_with_dot",
-        state,
-        tx,
-    )
-
-
-def test_register_name_consecutive_separators(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="a..b", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_consecutive_dots",
-        state,
-        tx,
-    )
-
-
-def test_register_name_invalid_char_at_symbol(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="alice@tos", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_at_symbol",
-        state,
-        tx,
-    )
-
-
-def test_register_name_reserved_admin(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="admin", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_reserved_admin",
-        state,
-        tx,
-    )
-
-
-def test_register_name_confusing_tos1_prefix(state_test_group) -> None:
-    state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="tos1abcdef", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_confusing_tos1_prefix",
-        state,
-        tx,
-    )
-
-
-def test_register_name_confusing_phishing_keyword(state_test_group) -> None:
+# (case name, requested name): names rejected or accepted purely on their
+# spelling, all registered from the base state at the standard fee.
+_NAME_CASES = [
+    ("register_name_too_short", "ab"),
+    ("register_name_too_long", _TOO_LONG_NAME),
+    ("register_name_min_length", _MIN_LENGTH_NAME),
+    ("register_name_exact_max_length", _MAX_LENGTH_NAME),
+    ("register_name_starts_with_digit", "1alice"),
+    ("register_name_ends_with_dot", "alice."),
+    ("register_name_consecutive_dots", "a..b"),
+    ("register_name_at_symbol", "alice@tos"),
+    ("register_name_reserved_admin", "admin"),
+    ("register_name_confusing_tos1_prefix", "tos1abcdef"),
+    ("register_name_confusing_phishing_support", "official_support"),
+]
+
+
+@pytest.mark.parametrize(
+    ("case", "name"),
+    _NAME_CASES,
+    ids=[c[0] for c in _NAME_CASES],
+)
+def test_register_name_validation(state_test_group, case: str, name: str) -> None:
     state = _base_state()
-    tx = _mk_register_name(ALICE, nonce=5, name="official_support", fee=REGISTRATION_FEE)
-    state_test_group(
-        "transactions/tns/register_name.json",
-        "register_name_confusing_phishing_support",
-        state,
-        tx,
-    )
+    tx = _mk_register_name(ALICE, nonce=5, name=name, fee=REGISTRATION_FEE)
+    state_test_group("transactions/tns/register_name.json", case, state, tx)
 
 
 def test_register_name_insufficient_fee(state_test_group) -> None:
@@ -7,8 +7,11 @@ the L0 codec layer without touching state transition logic.
 
 from __future__ import annotations
 
+import functools
+
+from tos_spec.codec_adapter import tx_to_serde_json
 from tos_spec.config import CHAIN_ID_DEVNET
-from tos_spec.test_accounts import ALICE, sign_transaction
+from tos_spec.test_accounts import ALICE, BOB, sign_transaction
 from tos_spec.types import (
     FeeType,
     Transaction,
@@ -22,14 +25,15 @@ def _hash(b: int) -> bytes:
     return bytes([b]) * 32
 
 
+@functools.cache
 def _valid_burn_hex() -> tuple[str, int]:
     """Encode a valid BURN tx and return (hex, total_byte_length).
 
     The BURN payload is fixed-size (asset:32 + amount:8 = 40 bytes),
-    making it ideal as a baseline for mutation tests.
+    making it ideal as a baseline for mutation tests. Encoded and signed once;
+    the mutation tests only read the result.
     """
     import tos_codec
-    from tos_spec.codec_adapter import tx_to_serde_json
 
     tx = Transaction(
         version=TxVersion.T1,
@@ -241,11 +245,10 @@ def test_wire_all_ones(vector_test_group) -> None:
 # --- Transfer-specific malformed tests ---
 
 
+@functools.cache
 def _valid_transfer_hex() -> tuple[str, int]:
-    """Encode a valid single-transfer tx."""
+    """Encode a valid single-transfer tx (once; see ``_valid_burn_hex``)."""
     import tos_codec
-    from tos_spec.codec_adapter import tx_to_serde_json
-    from tos_spec.test_accounts import BOB
 
     tx = Transaction(
         version=TxVersion.T1,
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional; dumps_fixture falls back to stdlib json
+    orjson = None
 
 from tos_spec.types import (
     AccountState,
@@ -24,6 +30,45 @@ from tos_spec.types import (
 )
 
 
+# Exact types whose orjson encoding matches ``json.dumps(indent=2)``. Floats
+# (exponent spelling, NaN/Infinity), dataclasses, enums and other subclasses
+# differ or are rejected by one side, so they never take the orjson path.
+_ORJSON_SAFE_SCALARS = (str, int, bool, type(None))
+
+
+def _is_orjson_safe(value: Any) -> bool:
+    kind = type(value)
+    if kind is dict:
+        return all(
+            type(k) is str and _is_orjson_safe(v) for k, v in value.items()
+        )
+    if kind is list or kind is tuple:
+        return all(_is_orjson_safe(v) for v in value)
+    return kind in _ORJSON_SAFE_SCALARS
+
+
+def dumps_fixture(payload: dict[str, Any]) -> bytes:
+    """Serialize ``payload`` as ``json.dumps(payload, indent=2).encode()``.
+
+    The result never depends on whether orjson is installed. orjson is used
+    only when the payload holds nothing but str-keyed dicts, lists, strings,
+    ints, bools and None, where its ``OPT_INDENT_2`` layout is byte-identical
+    to the stdlib. Payloads with other values (floats, dataclasses, ...),
+    integers wider than 64 bits, non-ASCII text or DEL go through the stdlib,
+    which also raises ``TypeError`` for values it cannot encode.
+    """
+    if orjson is not None and _is_orjson_safe(payload):
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        else:
+            # orjson writes DEL (0x7f) raw; the stdlib escapes it.
+            if data.isascii() and b"\x7f" not in data:
+                return data
+    return json.dumps(payload, indent=2).encode()
+
+
 def _hex_to_bytes(v: str) -> bytes:
     return bytes.fromhex(v)
 
@@ -36,13 +81,12 @@ def state_to_json(state: ChainState) -> dict[str, Any]:
     # Conformance daemon derives exported account `frozen/energy` from EnergyResource when present,
     # and computes `global_state.total_energy` as the sum of account energy. Normalize here so
     # fixtures line up with daemon export/digest behavior.
-    er_by_addr = state.energy_resources
     accounts_out: list[dict[str, Any]] = []
     total_energy = 0
     for a in state.accounts.values():
         frozen = a.frozen
         energy = a.energy
-        er = er_by_addr.get(a.address)
+        er = state.energy_resources.get(a.address)
         if er is not None:
             frozen = er.frozen_tos
             energy = er.energy
@@ -205,6 +249,15 @@ def state_from_json(data: dict[str, Any]) -> ChainState:
     return state
 
 
+def state_factory(build: Callable[[], ChainState]) -> Callable[[], ChainState]:
+    """Run ``build`` once and return a function handing out clones of its state.
+
+    Test modules decorate their base-state builders with this, so the state is
+    built at import and every test gets an independent copy to mutate.
+    """
+    return build().clone
+
+
 def _payload_to_json(payload: Any) -> Any:
     """Recursively convert a payload value, turning bytes into hex strings."""
     if payload is None:
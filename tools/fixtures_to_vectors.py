@@ -16,9 +16,11 @@ from pathlib import Path
 from typing import Any
 
 ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 sys.path.insert(0, str(ROOT / "src"))
 
 from tos_spec.state_digest import compute_state_digest
+from tools.fixtures_io import dumps_fixture
 
 MAPPING = {
     "api": "rpc",
@@ -191,7 +193,7 @@ def main() -> None:
                 )
             dest = vectors / "execution/transactions/wire_format_roundtrip.json"
             dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(json.dumps({"test_vectors": vectors_out}, indent=2))
+            dest.write_bytes(dumps_fixture({"test_vectors": vectors_out}))
             written.add(dest.resolve())
             count += 1
             continue
@@ -304,7 +306,7 @@ def main() -> None:
                 vectors_out.append(vec_entry)
             dest = dest.with_suffix(".json")
             if vectors_out:
-                dest.write_text(json.dumps({"test_vectors": vectors_out}, indent=2))
+                dest.write_bytes(dumps_fixture({"test_vectors": vectors_out}))
                 written.add(dest.resolve())
                 count += 1
             continue